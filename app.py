@@ -101,9 +101,9 @@ async def get_trade(
         
         # Execute trading analysis with error handling
         try:
-            # Note: propagate() only takes ticker and date
+            # Note: apropagate() only takes ticker and date
             # Model and round configuration must be done at graph initialization
-            final_state, processed_signal = ta.propagate(ticker, date)
+            final_state, processed_signal = await ta.apropagate(ticker, date)
 
             # Extract data from final_state
             result = {
@@ -0,0 +1,124 @@
+"""
+Shared fixtures of the graph tests.
+
+The graph tests run TradingAgentsGraph with a stand-in chat model and empty memories:
+- fake_llm: the FakeChatModel class, to build models with the behaviour a test needs
+- make_trading_graph: builds a TradingAgentsGraph on a model, with its files under tmp_path
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.agents.utils.agent_utils import Toolkit
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+MEMORY_NAMES = ["bull_memory", "bear_memory", "trader_memory", "invest_judge_memory", "risk_manager_memory"]
+
+
+class FakeChatModel(BaseChatModel):
+    """Answers with a reply derived from the first message only, after delay seconds.
+
+    It counts its calls and the most calls in flight at once, raises on call number fail_at
+    (once), and on call number pause_at sets paused and waits for resume.
+    """
+
+    delay: float = 0
+    fail_at: int = 0
+    pause_at: int = 0
+    calls: int = 0
+    active: int = 0
+    max_active: int = 0
+    lock: Any = None
+    paused: Any = None
+    resume: Any = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.paused = threading.Event()
+        self.resume = threading.Event()
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs,
+    ) -> ChatResult:
+        with self.lock:
+            self.calls += 1
+            if self.calls == self.fail_at:
+                raise TimeoutError("worker recycled")
+            pause = self.calls == self.pause_at
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if pause:
+                self.paused.set()
+                self.resume.wait(timeout=60)
+            time.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.active -= 1
+        reply = f"{str(messages[0].content)[:40]} FINAL TRANSACTION PROPOSAL: **BUY**"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+class NoMemory:
+    def get_memories(self, current_situation, n_matches=1):
+        return []
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeChatModel
+
+
+@pytest.fixture
+def make_trading_graph(tmp_path, monkeypatch):
+    """Factory of graphs running on a given model, logging and caching under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Toolkit, "_config", Toolkit._config.copy())
+    previous = get_config()
+
+    def make(llm, analysts=("market", "news"), checkpointer=None, config=None):
+        graph_config = {
+            **DEFAULT_CONFIG,
+            "project_dir": str(tmp_path),
+            "data_cache_dir": str(tmp_path / "cache"),
+            "memory_dir": str(tmp_path / "memory"),
+            "checkpointer": "none",
+            "llm_cache": False,
+            **(config or {}),
+        }
+        return TradingAgentsGraph(
+            list(analysts),
+            config=graph_config,
+            checkpointer=checkpointer,
+            deep_thinking_llm=llm,
+            quick_thinking_llm=llm,
+            memories={name: NoMemory() for name in MEMORY_NAMES},
+        )
+
+    yield make
+    set_config(previous)
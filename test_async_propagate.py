@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the asynchronous propagate API.
+
+This script tests, with a slow stand-in chat model:
+1. apropagate returns the same state and signal as propagate
+2. Concurrent apropagate calls overlap and leave the event loop responsive
+3. astream yields every step and ends with the final state
+4. Breaking out of astream early cancels the run cleanly
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.run_cache import current_run_cache
+
+DELAY = 0.1
+
+
+@pytest.fixture
+def trading_graph(make_trading_graph, fake_llm):
+    """A TradingAgentsGraph wired to a slow model, logging under tmp_path."""
+    return make_trading_graph(fake_llm(delay=DELAY))
+
+
+def test_apropagate_matches_propagate(trading_graph):
+    """The async run produces the same reports, decision and signal."""
+    state, signal = trading_graph.propagate("AAPL", "2024-05-10")
+    astate, asignal = asyncio.run(trading_graph.apropagate("AAPL", "2024-05-10"))
+
+    for key in ("market_report", "news_report", "investment_plan", "final_trade_decision"):
+        assert astate[key] == state[key], key
+    assert asignal == signal
+    assert os.path.exists("eval_results/AAPL/TradingAgentsStrategy_logs/full_states_log_2024-05-10.json")
+    print("✓ apropagate matches propagate")
+
+
+def test_concurrent_runs_overlap(trading_graph):
+    """Three runs' model calls overlap, and the loop keeps ticking while they are in flight."""
+    llm = trading_graph.quick_thinking_llm
+
+    async def main():
+        in_flight = []
+        done = asyncio.Event()
+
+        async def heartbeat():
+            while not done.is_set():
+                in_flight.append(llm.active)
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        results = await asyncio.gather(
+            *(trading_graph.apropagate(t, "2024-05-10") for t in ("AAPL", "NVDA", "MSFT"))
+        )
+        done.set()
+        await beat
+        return results, in_flight
+
+    results, in_flight = asyncio.run(main())
+
+    assert [state["company_of_interest"] for state, _ in results] == ["AAPL", "NVDA", "MSFT"]
+    for ticker in ("AAPL", "NVDA", "MSFT"):
+        assert os.path.exists(f"eval_results/{ticker}/TradingAgentsStrategy_logs")
+    assert llm.max_active == 3
+    # a model call blocking the loop would never be seen in flight by the heartbeat
+    assert max(in_flight) > 0
+    print(f"✓ {llm.max_active} runs' calls in flight at once, loop ticked {len(in_flight)} times")
+
+
+def test_astream_yields_steps(trading_graph):
+    """astream yields the state after each step and records the final state."""
+
+    async def collect():
+        return [chunk async for chunk in trading_graph.astream("AAPL", "2024-05-10")]
+
+    chunks = asyncio.run(collect())
+    assert len(chunks) > 5
+    assert chunks[-1]["final_trade_decision"]
+    assert trading_graph.curr_state is chunks[-1]
+    print("✓ astream yields every step")
+
+
+def test_astream_early_break(trading_graph):
+    """Stopping iteration early neither leaks the run cache nor fails to clean up."""
+    errors = []
+
+    async def consume():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        seen = 0
+        async for chunk in trading_graph.astream("AAPL", "2024-05-10"):
+            assert current_run_cache() is None
+            seen += 1
+            if seen == 2:
+                break
+
+        stream = trading_graph.astream("NVDA", "2024-05-10")
+        await stream.__anext__()
+        await stream.aclose()
+        return seen
+
+    assert asyncio.run(consume()) == 2
+    assert errors == []
+    assert trading_graph.log_states_dict == {}
+    print("✓ astream can be abandoned early")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the backtest driver and the memoized indicator series.
+
+This script tests:
+1. The backtester walks the trading days, reflects with realized returns and reports latency
+2. A rerun resumes from the checkpoint without repeating completed days
+3. Indicator series are computed once and reused across days
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import stockstats_utils
+from tradingagents.dataflows.price_store import YFIN_CSV_TEMPLATE, PriceStore
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+from tradingagents.graph.backtest import Backtester, format_report
+
+
+def write_prices(price_dir, symbol="TEST", periods=300):
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    prices = pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2024-01-01", periods=periods).strftime("%Y-%m-%d"),
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(1_000_000, 5_000_000, periods),
+        }
+    )
+    os.makedirs(price_dir, exist_ok=True)
+    prices.to_csv(os.path.join(price_dir, YFIN_CSV_TEMPLATE.format(symbol=symbol)), index=False)
+    return prices
+
+
+class FakeGraph:
+    def __init__(self, data_dir):
+        self.config = {"data_dir": data_dir}
+        self.propagated = []
+        self.reflections = []
+
+    def propagate(self, ticker, trade_date):
+        self.propagated.append(trade_date)
+        return {}, "BUY"
+
+    def reflect_and_remember(self, returns_losses):
+        self.reflections.append(returns_losses)
+
+
+@pytest.fixture
+def price_setup(tmp_path):
+    price_dir = str(tmp_path / "market_data" / "price_data")
+    prices = write_prices(price_dir)
+    store = PriceStore(price_dir, store_dir=str(tmp_path / "store"))
+    return str(tmp_path), prices, store
+
+
+def make_backtester(data_dir, store, checkpoint_path):
+    graph = FakeGraph(data_dir)
+    backtester = Backtester(graph, checkpoint_path=checkpoint_path, price_store=store)
+    return graph, backtester
+
+
+def test_backtest_reflects_with_realized_returns(price_setup, tmp_path):
+    """Every trading day is run once and reflected with its next-day close-to-close return."""
+    data_dir, prices, store = price_setup
+    graph, backtester = make_backtester(data_dir, store, str(tmp_path / "bt.json"))
+
+    report = backtester.run("TEST", "2024-01-06", "2024-01-12")
+
+    expected_days = ["2024-01-08", "2024-01-09", "2024-01-10", "2024-01-11", "2024-01-12"]
+    assert graph.propagated == expected_days
+    close = prices.set_index("Date")["Close"]
+    dates = list(close.index)
+    expected = [
+        (close.iloc[dates.index(d) + 1] / close[d] - 1) * 100 for d in expected_days
+    ]
+    np.testing.assert_allclose(graph.reflections, expected)
+    assert list(report["days"]) == expected_days
+    assert report["completed_this_run"] == 5
+    assert report["days_per_hour"] > 0
+    assert "2024-01-08" in format_report(report)
+
+    # no return is known after the last trading day
+    assert backtester.realized_return("TEST", dates[-1]) is None
+    assert backtester.realized_return("TEST", "2024-01-06") is None
+    print("✓ Backtest reflects with realized returns")
+
+
+def test_backtest_resumes_from_checkpoint(price_setup, tmp_path):
+    """A rerun over a wider range only runs the days missing from the checkpoint."""
+    data_dir, _, store = price_setup
+    checkpoint = str(tmp_path / "bt.json")
+
+    make_backtester(data_dir, store, checkpoint)[1].run("TEST", "2024-01-08", "2024-01-10")
+    graph, backtester = make_backtester(data_dir, store, checkpoint)
+    report = backtester.run("TEST", "2024-01-08", "2024-01-12")
+
+    assert graph.propagated == ["2024-01-11", "2024-01-12"]
+    assert len(report["days"]) == 5
+    assert report["completed_this_run"] == 2
+    print("✓ Backtest resumes from the checkpoint")
+
+
+def test_indicator_series_is_reused(price_setup, monkeypatch):
+    """Looking up an indicator for many days computes the series once."""
+    data_dir, prices, store = price_setup
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    monkeypatch.setattr(stockstats_utils, "get_price_store", lambda path: store)
+    monkeypatch.setattr(stockstats_utils, "get_config", lambda: {"indicator_engine": "native"})
+    stockstats_utils._table_indicator_series.cache_clear()
+
+    computed = []
+    compute_indicator = stockstats_utils.compute_indicator
+
+    def counting_compute(df, indicator, engine=None):
+        computed.append(indicator)
+        return compute_indicator(df, indicator, engine)
+
+    monkeypatch.setattr(stockstats_utils, "compute_indicator", counting_compute)
+
+    values = [
+        StockstatsUtils.get_stock_stats("TEST", "rsi", date, price_dir)
+        for date in prices["Date"][100:110]
+    ]
+    window = StockstatsUtils.get_stock_stats_range(
+        "TEST", "rsi", prices["Date"][100], prices["Date"][109], price_dir
+    )
+
+    assert computed == ["rsi"]
+    assert list(window.values()) == values
+    assert StockstatsUtils.get_stock_stats("TEST", "rsi", "2024-01-06", price_dir).startswith("N/A")
+    print("✓ Indicator series are reused")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for durable checkpointing of graph runs.
+
+This script tests, with a stand-in chat model that can fail part-way through a run:
+1. A run interrupted by an error resumes on its thread without repeating finished LLM calls
+2. The async API resumes the same way from the SQLite checkpoints
+3. Rerunning a finished (ticker, date) starts a clean run
+4. A completed run's checkpoints are deleted, so the database does not grow with every run
+5. A run of a (ticker, date) that is already running does not resume the live run's thread
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("langgraph.checkpoint.sqlite")
+
+from tradingagents.graph.checkpointing import (
+    create_checkpointer,
+    lease_path_for,
+    lease_thread,
+    thread_id_for,
+)
+
+
+@pytest.fixture
+def sqlite_config(tmp_path):
+    return {"checkpointer": "sqlite", "data_cache_dir": str(tmp_path / "cache")}
+
+
+@pytest.fixture
+def make_graph(make_trading_graph, sqlite_config):
+    """Graph on a model, checkpointing to the SQLite database through the given checkpointer."""
+
+    def make(llm, checkpointer):
+        config = sqlite_config if checkpointer is not None else None
+        return make_trading_graph(llm, checkpointer=checkpointer, config=config)
+
+    return make
+
+
+def thread_checkpoints(checkpointer, ticker, trade_date):
+    config = {"configurable": {"thread_id": thread_id_for(ticker, trade_date)}}
+    return list(checkpointer.list(config))
+
+
+@pytest.fixture
+def full_run(make_graph, fake_llm):
+    """LLM calls and final state of an uncheckpointed run."""
+    llm = fake_llm()
+    state, _ = make_graph(llm, None).propagate("AAPL", "2024-05-10")
+    return llm.calls, state
+
+
+def test_interrupted_run_resumes(sqlite_config, make_graph, fake_llm, full_run):
+    """A new process picks the run up after the last completed node."""
+    total, reference = full_run
+
+    llm = fake_llm(fail_at=6)
+    with pytest.raises(TimeoutError):
+        make_graph(llm, create_checkpointer(sqlite_config)).propagate("AAPL", "2024-05-10")
+
+    # a fresh graph and connection, as after a worker restart
+    checkpointer = create_checkpointer(sqlite_config)
+    assert thread_checkpoints(checkpointer, "AAPL", "2024-05-10")
+    llm = fake_llm()
+    state, signal = make_graph(llm, checkpointer).propagate("AAPL", "2024-05-10")
+    assert thread_checkpoints(checkpointer, "AAPL", "2024-05-10") == []
+
+    assert llm.calls == total - 5
+    assert state["final_trade_decision"] == reference["final_trade_decision"]
+    assert state["market_report"] == reference["market_report"]
+    assert len(state["messages"]) == len(reference["messages"])
+    assert "BUY" in signal
+    print(f"✓ Resumed run made {llm.calls} of {total} LLM calls")
+
+
+def test_async_run_resumes(sqlite_config, make_graph, fake_llm, full_run):
+    """apropagate resumes from the SQLite checkpoints too."""
+    total, reference = full_run
+
+    llm = fake_llm(fail_at=4)
+    with pytest.raises(TimeoutError):
+        asyncio.run(make_graph(llm, create_checkpointer(sqlite_config)).apropagate("NVDA", "2024-05-10"))
+
+    llm = fake_llm()
+    ta = make_graph(llm, create_checkpointer(sqlite_config))
+    state, _ = asyncio.run(ta.apropagate("NVDA", "2024-05-10"))
+
+    assert llm.calls == total - 3
+    assert thread_checkpoints(ta.checkpointer, "NVDA", "2024-05-10") == []
+    assert state["company_of_interest"] == "NVDA"
+    assert state["final_trade_decision"] == reference["final_trade_decision"]
+    print("✓ Async run resumed")
+
+
+def test_finished_run_starts_over(sqlite_config, make_graph, fake_llm, full_run):
+    """A finished thread is not reused: the rerun repeats every call on a clean state."""
+    total, reference = full_run
+
+    llm = fake_llm()
+    ta = make_graph(llm, create_checkpointer(sqlite_config))
+    ta.propagate("AAPL", "2024-05-10")
+    state, _ = ta.propagate("AAPL", "2024-05-10")
+
+    assert llm.calls == 2 * total
+    assert len(state["messages"]) == len(reference["messages"])
+    print("✓ Finished run starts over")
+
+
+def test_completed_stream_drops_checkpoints(sqlite_config, make_graph, fake_llm):
+    """A fully consumed astream deletes its thread; an abandoned one keeps it to resume."""
+    checkpointer = create_checkpointer(sqlite_config)
+    ta = make_graph(fake_llm(), checkpointer)
+
+    async def consume(ticker, steps=None):
+        seen = 0
+        async for _ in ta.astream(ticker, "2024-05-10"):
+            seen += 1
+            if seen == steps:
+                break
+
+    asyncio.run(consume("AAPL"))
+    asyncio.run(consume("MSFT", steps=2))
+    assert thread_checkpoints(checkpointer, "AAPL", "2024-05-10") == []
+    assert thread_checkpoints(checkpointer, "MSFT", "2024-05-10")
+    print("✓ Completed runs drop their checkpoints")
+
+
+def test_concurrent_same_key_runs(sqlite_config, make_graph, fake_llm, full_run):
+    """A second run of a live (ticker, date) runs on its own thread and leaves the first alone."""
+    total, reference = full_run
+
+    llm = fake_llm(pause_at=4)
+    checkpointer = create_checkpointer(sqlite_config)
+    ta = make_graph(llm, checkpointer)
+    results = []
+    first = threading.Thread(target=lambda: results.append(ta.propagate("AAPL", "2024-05-10")))
+    first.start()
+    assert llm.paused.wait(timeout=60)
+
+    # the first run is part-way through its thread: the second must not resume it
+    state, _ = ta.propagate("AAPL", "2024-05-10")
+    assert thread_checkpoints(checkpointer, "AAPL", "2024-05-10")
+    llm.resume.set()
+    first.join(timeout=60)
+
+    assert llm.calls == 2 * total
+    assert [s["final_trade_decision"] for s, _ in results + [(state, None)]] == [
+        reference["final_trade_decision"]
+    ] * 2
+    assert list(checkpointer.list(None)) == []
+    print("✓ Concurrent same-key runs each made every call once")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="cross-process leases need fcntl")
+def test_lease_is_held_across_processes(sqlite_config):
+    """Another process sharing the checkpoint database cannot lease a running thread."""
+    lease_path = lease_path_for(sqlite_config)
+    script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from tradingagents.graph.checkpointing import lease_thread
+with lease_thread("AAPL-2024-05-10", {lease_path!r}) as (thread_id, leased):
+    print(leased, thread_id)
+"""
+
+    def other_process():
+        return subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True, timeout=120
+        ).stdout.split()
+
+    with lease_thread("AAPL-2024-05-10", lease_path) as (thread_id, leased):
+        assert leased and thread_id == "AAPL-2024-05-10"
+        held, private_id = other_process()
+        assert held == "False" and private_id.startswith("AAPL-2024-05-10:")
+        with lease_thread("AAPL-2024-05-10", lease_path) as (_, leased_twice):
+            assert not leased_twice
+    assert other_process() == ["True", "AAPL-2024-05-10"]
+    print("✓ Leases are held across processes")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
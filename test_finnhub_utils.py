@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached Finnhub range loader.
+
+This script tests:
+1. Range queries return the same entries, in file order, as filtering every key
+2. Repeated calls reuse the parsed file until it changes on disk
+3. Hash-based dedup of insider entries matches the list-based dedup and does linear work
+"""
+
+import json
+import os
+import sys
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import finnhub_utils
+from tradingagents.dataflows.finnhub_utils import (
+    format_unique_entries,
+    get_data_in_range,
+    load_finnhub_data,
+)
+
+
+def write_news(data_dir, ticker, data):
+    folder = os.path.join(data_dir, "finnhub_data", "news_data")
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, f"{ticker}_data_formatted.json"), "w") as f:
+        json.dump(data, f)
+
+
+def test_range_matches_linear_filter(tmp_path):
+    """Bisect-based ranges equal the linear scan, keeping the file's key order."""
+    data = {
+        f"2024-{month:02d}-{day:02d}": ([{"headline": f"{month}/{day}"}] if day % 4 else [])
+        for month in (3, 1, 2)
+        for day in range(28, 0, -1)
+    }
+    write_news(str(tmp_path), "AAPL", data)
+
+    for start, end in [("2024-01-05", "2024-01-12"), ("2024-01-20", "2024-03-02"), ("2023", "2025"), ("2024-04-01", "2024-05-01")]:
+        expected = {k: v for k, v in data.items() if start <= k <= end and len(v) > 0}
+        result = get_data_in_range("AAPL", start, end, "news_data", str(tmp_path))
+        assert list(result.items()) == list(expected.items())
+    print("✓ Range queries match the linear filter")
+
+
+def test_reuses_parsed_file(tmp_path):
+    """The parsed file is served from memory and reloaded after it changes."""
+    write_news(str(tmp_path), "NVDA", {"2024-01-02": [{"headline": "a"}]})
+    first = load_finnhub_data("NVDA", "news_data", str(tmp_path))
+    assert load_finnhub_data("NVDA", "news_data", str(tmp_path)) is first
+
+    path = os.path.join(str(tmp_path), "finnhub_data", "news_data", "NVDA_data_formatted.json")
+    write_news(str(tmp_path), "NVDA", {"2024-01-03": [{"headline": "b"}]})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    result = get_data_in_range("NVDA", "2024-01-01", "2024-01-31", "news_data", str(tmp_path))
+    assert result == {"2024-01-03": [{"headline": "b"}]}
+    print("✓ Parsed files are cached and refreshed")
+
+
+def make_filings(n):
+    """n insider filings over n // 5 days, each filing repeated on two days."""
+    data = {}
+    for i in range(n):
+        filing = {
+            "name": f"Insider {i % 97}",
+            "share": 1000 + i,
+            "change": -i,
+            "filingDate": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "transactionPrice": 100.0 + i % 13,
+            "transactionCode": "S",
+        }
+        for day in (i // 5, i // 5 + 1):
+            # same filing with a different key order on the second day
+            data.setdefault(f"day-{day:06d}", []).append(
+                filing if day == i // 5 else dict(reversed(list(filing.items())))
+            )
+    return data
+
+
+def list_dedup(data, format_entry):
+    """The original quadratic dedup with string concatenation."""
+    result_str = ""
+    seen_dicts = []
+    for date, entries in data.items():
+        for entry in entries:
+            if entry not in seen_dicts:
+                result_str += format_entry(entry)
+                seen_dicts.append(entry)
+    return result_str
+
+
+def format_filing(entry):
+    return f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\n\n"
+
+
+def test_dedup_matches_and_scales(monkeypatch):
+    """Hash dedup gives the list-based output, keying each entry once however many there are."""
+    data = make_filings(500)
+    data["day-000000"].append({**data["day-000000"][0], "share": 1000.0})
+    assert format_unique_entries(data, format_filing) == list_dedup(data, format_filing)
+
+    canonical_key = finnhub_utils._canonical_key
+    keyed = []
+
+    def counting_key(value):
+        keyed.append(1)
+        return canonical_key(value)
+
+    monkeypatch.setattr(finnhub_utils, "_canonical_key", counting_key)
+    work = {}
+    for n in (1000, 2000, 4000):
+        data = make_filings(n)
+        keyed.clear()
+        assert format_unique_entries(data, format_filing) == list_dedup(data, format_filing)
+        work[n] = len(keyed)
+        print(f"{n} filings: {work[n]} keys computed")
+    # no pairwise comparisons: the work grows with the number of entries
+    assert work[2000] == 2 * work[1000] and work[4000] == 4 * work[1000]
+    print("✓ Hash dedup matches and scales")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
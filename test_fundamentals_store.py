@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the ticker-indexed SimFin fundamentals store.
+
+This script tests:
+1. As-of lookups return the same row as a full scan of the statement file
+2. Reports published after the current date are never returned
+3. The shared store is reloaded when the file changes
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.fundamentals_store import get_fundamentals_store
+
+
+def write_statements(path, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for ticker in ("AAPL", "MSFT", "NVDA", "TSLA"):
+        for quarter in pd.date_range("2019-03-31", periods=16, freq="QE"):
+            publish = quarter + pd.Timedelta(days=int(rng.integers(20, 60)))
+            rows.append(
+                {
+                    "Ticker": ticker,
+                    "SimFinId": int(rng.integers(1, 100000)),
+                    "Currency": "USD",
+                    "Report Date": quarter.strftime("%Y-%m-%d"),
+                    "Publish Date": publish.strftime("%Y-%m-%d"),
+                    "Revenue": int(rng.integers(1e8, 1e10)),
+                }
+            )
+    # a restatement published on the same day as the original report
+    rows.append(dict(rows[3], Revenue=1))
+    df = pd.DataFrame(rows).sample(frac=1, random_state=seed)
+    df.to_csv(path, sep=";", index=False)
+
+
+def scan_latest(path, ticker, curr_date):
+    """The original full-scan lookup."""
+    df = pd.read_csv(path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    if filtered_df.empty:
+        return None
+    return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+
+def test_matches_full_scan(tmp_path):
+    """Every as-of lookup renders exactly like the full scan did."""
+    path = str(tmp_path / "us-income-quarterly.csv")
+    write_statements(path)
+    store = get_fundamentals_store(path)
+
+    for ticker in ("AAPL", "MSFT", "TSLA", "GOOG"):
+        for curr_date in pd.date_range("2019-01-01", "2023-06-30", freq="17D"):
+            curr_date = curr_date.strftime("%Y-%m-%d")
+            expected = scan_latest(path, ticker, curr_date)
+            actual = store.latest_report(ticker, curr_date)
+            if expected is None:
+                assert actual is None
+            else:
+                assert str(actual.drop("SimFinId")) == str(expected.drop("SimFinId"))
+                assert actual["Publish Date"] <= pd.to_datetime(curr_date, utc=True)
+    print("✓ As-of lookups match the full scan")
+
+
+def test_reloads_changed_file(tmp_path):
+    """A rewritten statement file is picked up by the shared store."""
+    path = str(tmp_path / "us-balance-annual.csv")
+    write_statements(path, seed=1)
+    store = get_fundamentals_store(path)
+    assert get_fundamentals_store(path) is store
+
+    write_statements(path, seed=2)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    reloaded = get_fundamentals_store(path)
+    assert reloaded is not store
+    assert str(reloaded.latest_report("NVDA", "2022-12-31")) == str(
+        scan_latest(path, "NVDA", "2022-12-31")
+    )
+    print("✓ Changed files are reloaded")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
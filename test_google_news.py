@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent Google News scraper.
+
+This script tests, against a local stand-in server with canned result pages:
+1. All pages are scraped in order and scraping stops at the last page
+2. Pages are fetched concurrently, within the concurrency bound
+3. Request starts respect the politeness rate limit
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.googlenews_utils import (
+    RateLimiter,
+    getNewsDataConcurrent,
+    parse_news_page,
+)
+
+NUM_PAGES = 5
+
+
+def result_page(page):
+    results = "".join(
+        f"""
+        <div class="SoaBEf">
+          <a href="https://news.example/{page}/{i}">
+            <div class="MBeuO">Headline {page}-{i} <b>bold</b></div>
+          </a>
+          <div class="GI74Re">Snippet {page}-{i}</div>
+          <div class="LfVVr">{i} days ago</div>
+          <div class="NUnG9d"><span>Source {i}</span><span>ignored</span></div>
+        </div>"""
+        for i in range(10)
+    )
+    next_link = '<a id="pnnext" href="#">Next</a>' if page < NUM_PAGES - 1 else ""
+    return f"<html><body>{results}{next_link}</body></html>"
+
+
+class NewsServer:
+    def __init__(self, delay=0.2):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                page = int(params["start"][0]) // 10
+                with lock:
+                    server.requests.append((page, params["q"][0]))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(delay)
+                body = (result_page(page) if page < NUM_PAGES else "<html></html>").encode()
+                with lock:
+                    server.in_flight -= 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/search"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def news_server():
+    server = NewsServer()
+    yield server
+    server.close()
+
+
+def test_scrapes_all_pages_in_order(news_server):
+    """Every result of every page is returned in page order."""
+    results = getNewsDataConcurrent(
+        "AAPL+stock",
+        "2024-05-01",
+        "2024-05-08",
+        max_concurrency=2,
+        requests_per_second=0,
+        base_url=news_server.url,
+    )
+    assert len(results) == NUM_PAGES * 10
+    assert results[0] == {
+        "link": "https://news.example/0/0",
+        "title": "Headline 0-0 bold",
+        "snippet": "Snippet 0-0",
+        "date": "0 days ago",
+        "source": "Source 0",
+    }
+    assert [r["title"] for r in results[::10]] == [
+        f"Headline {page}-0 bold" for page in range(NUM_PAGES)
+    ]
+    assert {q for _, q in news_server.requests} == {"AAPL stock"}
+    print("✓ All pages scraped in order")
+
+
+def test_concurrency_is_bounded(news_server):
+    """Pages are fetched several at a time but never above the bound."""
+    getNewsDataConcurrent(
+        "NVDA", "2024-05-01", "2024-05-08",
+        max_concurrency=3, requests_per_second=0, base_url=news_server.url,
+    )
+    assert news_server.max_in_flight == 3
+    # the 5 pages are fetched in two waves of 3, the last page past the end included
+    assert sorted(page for page, _ in news_server.requests) == list(range(6))
+    print("✓ Concurrent fetches stay within the bound")
+
+
+def test_rate_limit(news_server, monkeypatch):
+    """Request starts are spaced by the politeness limit."""
+    calls, starts = [], []
+    wait = RateLimiter.wait
+
+    async def recording_wait(self):
+        calls.append(asyncio.get_running_loop().time())
+        await wait(self)
+        starts.append(asyncio.get_running_loop().time())
+
+    # times are read off the event loop's clock as requests reach and leave the limiter, so a
+    # slow server or test machine can only delay the starts
+    monkeypatch.setattr(RateLimiter, "wait", recording_wait)
+    getNewsDataConcurrent(
+        "TSLA", "2024-05-01", "2024-05-08",
+        max_concurrency=4, requests_per_second=20, base_url=news_server.url,
+    )
+    assert len(starts) == len(news_server.requests) == 8
+    # the k-th request starts no earlier than k intervals after the first one asked
+    for k, start in enumerate(sorted(starts)):
+        assert start >= calls[0] + k * 0.05 - 1e-3
+    print("✓ Rate limit respected")
+
+
+def test_parser_skips_incomplete_results():
+    """Results missing a field are skipped, like the BeautifulSoup parser did."""
+    html = result_page(NUM_PAGES - 1).replace('<div class="GI74Re">Snippet 4-3</div>', "")
+    results, has_next = parse_news_page(html)
+    assert len(results) == 9 and not has_next
+    print("✓ Incomplete results are skipped")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed indicator cube.
+
+This script tests, for both indicator engines:
+1. Cube lookups equal get_stock_stats_range, value for value
+2. Indicator reports read from the cube are identical to computed ones
+3. The cube is bypassed when a source CSV changes or another engine is configured
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.indicator_cube import build_indicator_cube, get_indicator_cube
+from tradingagents.dataflows.price_store import YFIN_CSV_TEMPLATE
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+INDICATORS = ["close_10_ema", "macd", "rsi", "boll_ub", "atr", "vwma"]
+TICKERS = ["AAPL", "NVDA"]
+
+
+def write_price_csv(price_dir, symbol, start="2023-01-02", periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    data = pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.003, periods)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Adj Close": close * 0.98,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+        }
+    )
+    path = os.path.join(price_dir, YFIN_CSV_TEMPLATE.format(symbol=symbol))
+    data.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(params=["stockstats", "native"])
+def data_dir(request, tmp_path, monkeypatch):
+    """A data directory with two tickers' price CSVs, with the engine under test configured."""
+    if request.param == "stockstats":
+        pytest.importorskip("stockstats")
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    # the second ticker starts later, so the cube has dates it does not trade on
+    write_price_csv(str(price_dir), "AAPL")
+    write_price_csv(str(price_dir), "NVDA", start="2023-03-01", periods=200, seed=1)
+
+    previous = get_config()
+    set_config(
+        {
+            "data_dir": str(tmp_path),
+            "data_cache_dir": str(tmp_path / "cache"),
+            "indicator_engine": request.param,
+        }
+    )
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+    yield str(tmp_path)
+    set_config(previous)
+
+
+def test_lookups_match_computed_range(data_dir):
+    """Every cube window equals the one computed from the price history."""
+    build_indicator_cube(data_dir, indicators=INDICATORS)
+    cube = get_indicator_cube(data_dir)
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+
+    for ticker in TICKERS:
+        for indicator in INDICATORS:
+            assert cube.has(ticker, indicator)
+            for start_date, end_date in [("2023-01-01", "2024-06-01"), ("2023-04-08", "2023-05-02")]:
+                expected = StockstatsUtils.get_stock_stats_range(
+                    ticker, indicator, start_date, end_date, price_dir
+                )
+                actual = cube.get_range(ticker, indicator, start_date, end_date)
+                actual = {date: value for date, value in actual.items() if date in expected}
+                assert list(actual) == list(expected)
+                assert [str(v) for v in actual.values()] == [str(v) for v in expected.values()]
+                assert all(type(value) is float for value in actual.values())
+    print("✓ Cube lookups match the computed ranges")
+
+
+def test_reports_are_identical(data_dir):
+    """The market analyst's indicator report reads the same with and without the cube."""
+    computed = [
+        interface.get_stock_stats_indicators_window(ticker, indicator, "2023-06-15", 30, False)
+        for ticker in TICKERS
+        for indicator in INDICATORS
+    ]
+    build_indicator_cube(data_dir, indicators=INDICATORS)
+    from_cube = [
+        interface.get_stock_stats_indicators_window(ticker, indicator, "2023-06-15", 30, False)
+        for ticker in TICKERS
+        for indicator in INDICATORS
+    ]
+    assert from_cube == computed
+    assert "2023-06-15: 1" in computed[0]
+    print("✓ Reports from the cube are identical")
+
+
+def test_stale_cube_is_bypassed(data_dir):
+    """A changed source CSV or a different configured engine falls back to computing."""
+    build_indicator_cube(data_dir, indicators=INDICATORS)
+    cube = get_indicator_cube(data_dir)
+    assert cube.engine == get_config()["indicator_engine"]
+    assert cube.has("AAPL", "rsi")
+    assert not cube.has("AAPL", "kdjk")
+    assert not cube.has("MSFT", "rsi")
+
+    other = "native" if cube.engine == "stockstats" else "stockstats"
+    set_config({"indicator_engine": other})
+    assert not cube.has("AAPL", "rsi")
+    set_config({"indicator_engine": cube.engine})
+
+    csv_path = write_price_csv(
+        os.path.join(data_dir, "market_data", "price_data"), "AAPL", periods=320, seed=2
+    )
+    os.utime(csv_path, ns=(0, os.stat(csv_path).st_mtime_ns + 1_000_000))
+    assert not cube.has("AAPL", "rsi")
+    assert cube.has("NVDA", "rsi")
+
+    # a rebuild is picked up by the next lookup
+    build_indicator_cube(data_dir, indicators=INDICATORS)
+    assert get_indicator_cube(data_dir).has("AAPL", "rsi")
+    print("✓ Stale cubes are bypassed")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the native NumPy indicator engine.
+
+This script tests:
+1. Every supported indicator matches stockstats within tolerance
+2. The EMA kernel matches pandas ewm, including NaN gaps
+3. Unsupported indicators are rejected
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.indicator_engine import (
+    SUPPORTED_INDICATORS,
+    IndicatorEngine,
+    compute_indicators,
+    ewm_mean,
+)
+
+
+def make_prices(periods=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, periods)))
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2018-01-02", periods=periods).strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.003, periods)),
+            "High": close * (1 + np.abs(rng.normal(0, 0.01, periods))),
+            "Low": close * (1 - np.abs(rng.normal(0, 0.01, periods))),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+        }
+    )
+
+
+def test_matches_stockstats():
+    """All indicators of the market analyst agree with stockstats."""
+    stockstats = pytest.importorskip("stockstats")
+
+    prices = make_prices()
+    native = compute_indicators(prices)
+    wrapped = stockstats.wrap(prices.copy())
+
+    for indicator in SUPPORTED_INDICATORS:
+        expected = wrapped[indicator].values
+        np.testing.assert_allclose(
+            native[indicator], expected, rtol=1e-9, atol=1e-9, err_msg=indicator
+        )
+    print("✓ Native indicators match stockstats")
+
+
+def test_ewm_matches_pandas():
+    """The blockwise EMA kernel equals pandas ewm(adjust=True) on long series with gaps."""
+    rng = np.random.default_rng(1)
+    values = rng.normal(0, 1, 10_000)
+    values[[5, 6, 700, 9000]] = np.nan
+
+    for alpha in (2 / 11, 2 / 27, 1 / 14, 0.5):
+        expected = pd.Series(values).ewm(alpha=alpha, adjust=True).mean().values
+        np.testing.assert_allclose(ewm_mean(values, alpha), expected, rtol=1e-10, atol=1e-12)
+    print("✓ EMA kernel matches pandas")
+
+
+def test_unsupported_indicator():
+    """Unknown indicator names raise a ValueError."""
+    engine = IndicatorEngine(make_prices(periods=50))
+    assert len(engine.get("close_5_sma")) == 50
+    with pytest.raises(ValueError):
+        engine.get("kdjk")
+    print("✓ Unsupported indicators are rejected")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass indicator window report.
+
+This script tests, on a fixed price CSV:
+1. For each engine, the window report equals the one assembled from per-day lookups
+2. The native engine's report has the same lines as stockstats', with values equal within tolerance
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.relativedelta import relativedelta
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.price_store import YFIN_CSV_TEMPLATE
+
+pytest.importorskip("stockstats")
+
+INDICATORS = ["close_50_sma", "close_10_ema", "macd", "rsi", "boll_ub", "atr", "vwma", "mfi"]
+CURR_DATE = "2023-08-15"
+LOOK_BACK_DAYS = 30
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A data directory holding one fixed price CSV, with its caches under tmp_path."""
+    rng = np.random.default_rng(7)
+    periods = 250
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, periods)))
+    prices = pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2022-10-03", periods=periods).strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.003, periods)),
+            "High": close * (1 + np.abs(rng.normal(0, 0.01, periods))),
+            "Low": close * (1 - np.abs(rng.normal(0, 0.01, periods))),
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+        }
+    )
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    prices.to_csv(price_dir / YFIN_CSV_TEMPLATE.format(symbol="TEST"), index=False)
+
+    previous = get_config()
+    set_config({"data_dir": str(tmp_path), "data_cache_dir": str(tmp_path / "cache")})
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+    yield str(tmp_path)
+    set_config(previous)
+
+
+def per_day_report(indicator):
+    """The window as the per-day path built it: one single-day stockstats lookup per day."""
+    curr_date = datetime.strptime(CURR_DATE, "%Y-%m-%d")
+    before = curr_date - relativedelta(days=LOOK_BACK_DAYS)
+    window = interface.get_stock_stats_indicators_window(
+        "TEST", indicator, CURR_DATE, LOOK_BACK_DAYS, False
+    )
+    header, _, _ = window.partition("\n\n")
+    _, _, description = window.rpartition("\n\n")
+
+    lines = ""
+    price_table = interface.get_price_store(
+        os.path.join(interface.DATA_DIR, "market_data", "price_data")
+    ).load("TEST")
+    while curr_date >= before:
+        day = curr_date.strftime("%Y-%m-%d")
+        if price_table.contains(day):
+            value = interface.get_stockstats_indicator("TEST", indicator, day, False)
+            lines += f"{day}: {value}\n"
+        curr_date -= relativedelta(days=1)
+    return f"{header}\n\n{lines}\n\n{description}"
+
+
+def window_reports(engine):
+    set_config({"indicator_engine": engine})
+    return {
+        indicator: interface.get_stock_stats_indicators_window(
+            "TEST", indicator, CURR_DATE, LOOK_BACK_DAYS, False
+        )
+        for indicator in INDICATORS
+    }
+
+
+@pytest.mark.parametrize("engine", ["stockstats", "native"])
+def test_window_matches_per_day_lookups(data_dir, engine):
+    """The single-pass window reads exactly like the per-day reports."""
+    reports = window_reports(engine)
+    for indicator in INDICATORS:
+        assert reports[indicator] == per_day_report(indicator), indicator
+        assert f"{CURR_DATE}: " in reports[indicator]
+    print("✓ Window matches the per-day lookups")
+
+
+def split_report(report):
+    """The report's text with the values taken out, and the values."""
+    lines, values = [], []
+    for line in report.splitlines():
+        day, sep, value = line.partition(": ")
+        if sep and len(day) == 10 and day[4] == "-":
+            lines.append(day)
+            values.append(float(value))
+        else:
+            lines.append(line)
+    return lines, values
+
+
+def test_native_engine_report_matches_stockstats(data_dir):
+    """Same header, days and description; the values agree to the last few bits."""
+    native, stockstats = window_reports("native"), window_reports("stockstats")
+    for indicator in INDICATORS:
+        native_lines, native_values = split_report(native[indicator])
+        lines, values = split_report(stockstats[indicator])
+        assert native_lines == lines, indicator
+        assert len(values) > 15
+        np.testing.assert_allclose(native_values, values, rtol=1e-12, err_msg=indicator)
+    print("✓ Native engine matches the stockstats report")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
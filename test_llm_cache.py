@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite LLM response cache.
+
+This script tests:
+1. A rerun of the graph is served from the cache without calling the model
+2. Keys depend on the messages and the model parameters, and tool calls round-trip
+3. Least recently used responses are evicted once the size limit is exceeded
+"""
+
+import os
+import sys
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.graph.llm_cache import SQLiteLLMCache, create_llm_cache
+
+
+@pytest.fixture
+def run_graph(make_trading_graph):
+    def run(llm):
+        final_state, _ = make_trading_graph(llm).propagate("AAPL", "2024-05-10")
+        return final_state
+
+    return run
+
+
+def test_rerun_is_served_from_cache(tmp_path, run_graph, fake_llm):
+    """The second run makes no model calls and reproduces the first run's state."""
+    config = {"llm_cache": True, "data_cache_dir": str(tmp_path)}
+    first_llm = fake_llm(cache=create_llm_cache(config))
+    first = run_graph(first_llm)
+
+    # a new model object and cache handle, as in a new process
+    cache = SQLiteLLMCache(os.path.join(str(tmp_path), "llm_cache.sqlite"))
+    second_llm = fake_llm(cache=cache)
+    second = run_graph(second_llm)
+
+    assert first_llm.calls > 5
+    assert second_llm.calls == 0
+    assert len(cache) == first_llm.calls
+    for key in ("market_report", "news_report", "investment_plan", "final_trade_decision"):
+        assert second[key] == first[key], key
+    assert create_llm_cache({"data_cache_dir": str(tmp_path)}) is None
+    print(f"✓ Rerun served {len(cache)} responses from cache")
+
+
+def test_keys_and_round_trip(tmp_path, fake_llm):
+    """Messages and parameters are part of the key; tool calls survive the round trip."""
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+    llm = fake_llm(cache=cache)
+
+    llm.invoke([HumanMessage(content="hello")])
+    llm.invoke([HumanMessage(content="hello")])
+    llm.invoke([HumanMessage(content="hello again")])
+    llm.invoke([HumanMessage(content="hello")], stop=["\n"])
+    assert llm.calls == 3
+
+    message = AIMessage(
+        content="",
+        tool_calls=[{"name": "get_YFin_data", "args": {"symbol": "AAPL"}, "id": "call_1"}],
+    )
+    cache.update("prompt", "model", [ChatGeneration(message=message, generation_info={"n": 1})])
+    (generation,) = cache.lookup("prompt", "model")
+    assert generation.message.tool_calls == message.tool_calls
+    assert generation.generation_info == {"n": 1}
+    assert cache.lookup("prompt", "other model") is None
+    print("✓ Keys and round trip")
+
+
+def test_size_based_eviction(tmp_path):
+    """Only the most recently used responses that fit in max_bytes are kept."""
+    generations = [ChatGeneration(message=AIMessage(content="x" * 500))]
+    entry_size = len(SQLiteLLMCache._dumps(generations))
+    # room for three responses
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"), max_bytes=int(3.5 * entry_size))
+
+    def store(name):
+        cache.update(name, "model", generations)
+
+    for name in ("a", "b", "c"):
+        store(name)
+        time.sleep(0.01)
+    assert cache.lookup("a", "model") is not None  # "a" is now the most recently used
+    time.sleep(0.01)
+    store("d")
+
+    assert cache.size_bytes() <= cache.max_bytes
+    assert len(cache) == 3
+    assert cache.lookup("d", "model") is not None
+    assert cache.lookup("a", "model") is not None
+    assert cache.lookup("b", "model") is None
+    print(f"✓ Eviction keeps {len(cache)} entries")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
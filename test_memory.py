@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the embedding requests of FinancialSituationMemory.
+
+This script tests, against a local fake OpenAI embeddings endpoint:
+1. add_situations embeds all situations in one batched request
+2. Within a run, the five memories embed the same situation once
+3. Outside a run every lookup is embedded, and the matches are unchanged
+4. Reflections storing the same situation in every memory embed it once
+5. Memories in a memory directory are shared by graphs and survive a restart, with either backend
+"""
+
+import base64
+import json
+import os
+import subprocess
+import sys
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.dataflows.run_cache import run_cache
+
+SITUATIONS = [
+    ("High inflation with rising rates", "Favor consumer staples and utilities."),
+    ("Tech selling pressure from institutions", "Trim high-growth tech exposure."),
+    ("Strong dollar hurting emerging markets", "Hedge currency exposure."),
+    ("Sector rotation with rising yields", "Rebalance toward rate beneficiaries."),
+]
+
+
+def embed(text):
+    """Letter-frequency vector, so similar texts get similar embeddings."""
+    vector = np.zeros(26, dtype=np.float32)
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1
+    return vector / max(np.linalg.norm(vector), 1e-9)
+
+
+class FakeEmbeddings:
+    """Serves /v1/embeddings and records the inputs of every request."""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+                server.requests.append(inputs)
+                data = []
+                for index, text in enumerate(inputs):
+                    vector = embed(text)
+                    if body.get("encoding_format") == "base64":
+                        value = base64.b64encode(vector.tobytes()).decode()
+                    else:
+                        value = vector.tolist()
+                    data.append({"object": "embedding", "index": index, "embedding": value})
+                payload = json.dumps(
+                    {
+                        "object": "list",
+                        "data": list(reversed(data)),
+                        "model": body["model"],
+                        "usage": {"prompt_tokens": 1, "total_tokens": 1},
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    server = FakeEmbeddings()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    yield server
+    server.httpd.shutdown()
+
+
+def make_memories(server, count):
+    config = {"backend_url": server.url}
+    return [FinancialSituationMemory(f"memory_{uuid.uuid4().hex}", config) for _ in range(count)]
+
+
+def test_add_situations_is_batched(fake_openai):
+    """All situations are embedded by a single request, in order."""
+    (memory,) = make_memories(fake_openai, 1)
+    memory.add_situations(SITUATIONS)
+
+    assert fake_openai.requests == [[situation for situation, _ in SITUATIONS]]
+    stored = memory.situation_collection.get(include=["embeddings", "documents"])
+    for document, embedding in zip(stored["documents"], stored["embeddings"]):
+        np.testing.assert_allclose(embedding, embed(document), rtol=1e-6)
+    print("✓ add_situations is batched")
+
+
+def test_run_embeds_situation_once(fake_openai):
+    """The five memories looking up the same situation in a run share one embedding."""
+    memories = make_memories(fake_openai, 5)
+    for memory in memories:
+        memory.add_situations(SITUATIONS)
+    fake_openai.requests.clear()
+    situation = "Institutions selling tech while rates rise"
+
+    with run_cache():
+        results = [memory.get_memories(situation, n_matches=2) for memory in memories]
+    assert fake_openai.requests == [[situation]]
+
+    outside = memories[0].get_memories(situation, n_matches=2)
+    memories[1].get_memories(situation, n_matches=2)
+    assert len(fake_openai.requests) == 3
+
+    assert all(result == outside for result in results)
+    assert outside[0]["recommendation"] == "Trim high-growth tech exposure."
+    print("✓ One embedding request per run")
+
+
+def test_reflections_embed_situation_once(fake_openai):
+    """Storing one situation in every memory within a run embeds it once."""
+    memories = make_memories(fake_openai, 5)
+    situation = "Strong dollar with rising yields"
+
+    with run_cache():
+        for i, memory in enumerate(memories):
+            memory.add_situations([(situation, f"lesson {i}")])
+        memories[0].get_memories(situation)
+
+    assert fake_openai.requests == [[situation]]
+    assert [memory.situation_collection.count() for memory in memories] == [1] * 5
+    print("✓ Reflections embed the situation once")
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_named_memories_are_shared_and_persistent(fake_openai, tmp_path, backend):
+    """A second graph reuses the named collection, and a new process starts warm."""
+    config = {
+        "backend_url": fake_openai.url,
+        "memory_dir": str(tmp_path / "memory"),
+        "memory_backend": backend,
+    }
+    first = FinancialSituationMemory("bull_memory", config)
+    first.add_situations(SITUATIONS[:2])
+    second = FinancialSituationMemory("bull_memory", config)
+    second.add_situations(SITUATIONS[2:])
+    assert first.situation_collection.count() == second.situation_collection.count() == 4
+    if backend == "chroma":
+        assert second.chroma_client is first.chroma_client
+    else:
+        assert second.situation_collection is first.situation_collection
+
+    script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+memory = FinancialSituationMemory("bull_memory", {config!r})
+print(memory.situation_collection.count())
+print(memory.get_memories("Institutions selling tech", n_matches=1)[0]["recommendation"])
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, timeout=120
+    ).stdout.splitlines()
+    assert output[-2:] == ["4", "Trim high-growth tech exposure."]
+    print("✓ Memories are shared and persistent")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
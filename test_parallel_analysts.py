@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel analyst fan-out of the agent graph.
+
+This script tests, with a slow stand-in chat model:
+1. Parallel mode produces the same reports and decision as the sequential chain
+2. The analysts' model calls overlap in parallel mode and never in the sequential chain
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+ANALYSTS = ["market", "social", "news", "fundamentals"]
+DELAY = 0.3
+
+
+@pytest.fixture
+def run_graph(make_trading_graph, fake_llm):
+    def run(parallel_analysts):
+        # tool nodes are never reached: the model answers without tool calls
+        llm = fake_llm(delay=DELAY)
+        ta = make_trading_graph(llm, ANALYSTS, config={"parallel_analysts": parallel_analysts})
+        final_state, _ = ta.propagate("AAPL", "2024-05-10")
+        return final_state, llm.max_active
+
+    return run
+
+
+def test_parallel_matches_sequential(run_graph):
+    """Same reports and decision, with the four analysts' calls in flight at once."""
+    sequential, sequential_active = run_graph(parallel_analysts=False)
+    parallel, parallel_active = run_graph(parallel_analysts=True)
+
+    for key in ("market_report", "sentiment_report", "news_report", "fundamentals_report"):
+        assert parallel[key] and parallel[key] == sequential[key], key
+    assert parallel["final_trade_decision"] == sequential["final_trade_decision"]
+
+    assert sequential_active == 1
+    assert parallel_active == len(ANALYSTS)
+    print(f"✓ At most {sequential_active} call in flight sequentially, {parallel_active} in parallel")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the data prefetch stage and the per-run cache.
+
+This script tests:
+1. Prefetched dataflow results are served from the run cache inside the graph
+2. Runs do not share their caches, and calls outside a run are not cached
+"""
+
+import os
+import sys
+import threading
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.agents.utils.agent_utils import Toolkit, create_data_prefetch
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.run_cache import current_run_cache, run_cache
+
+
+class State(TypedDict):
+    company_of_interest: str
+    trade_date: str
+    fundamentals_report: str
+
+
+class FakeStatement:
+    def latest_report(self, ticker, curr_date):
+        return None
+
+
+@pytest.fixture
+def counted_sources(monkeypatch):
+    """Replace the on-disk Finnhub and SimFin sources with counting stand-ins."""
+    calls = []
+    lock = threading.Lock()
+
+    def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
+        with lock:
+            calls.append((data_type, ticker, end_date))
+        entry = {"year": 2024, "month": 5, "change": 10, "mspr": 0.5, "filingDate": end_date}
+        entry.update(name="Insider", share=100, transactionPrice=1.0, transactionCode="S")
+        return {end_date: [entry]}
+
+    def get_fundamentals_store(path):
+        with lock:
+            calls.append(("simfin", os.path.basename(path)))
+        return FakeStatement()
+
+    monkeypatch.setattr(interface, "get_data_in_range", get_data_in_range)
+    monkeypatch.setattr(interface, "get_fundamentals_store", get_fundamentals_store)
+    monkeypatch.setitem(Toolkit._config, "online_tools", False)
+    return calls
+
+
+def build_graph(seen):
+    def fundamentals_tool(state):
+        seen.append(current_run_cache())
+        report = interface.get_finnhub_company_insider_sentiment(
+            state["company_of_interest"], state["trade_date"], 30
+        )
+        return {"fundamentals_report": report}
+
+    workflow = StateGraph(State)
+    workflow.add_node("Data Prefetch", create_data_prefetch(Toolkit(), ["fundamentals"]))
+    workflow.add_node("Fundamentals Tool", fundamentals_tool)
+    workflow.add_edge(START, "Data Prefetch")
+    workflow.add_edge("Data Prefetch", "Fundamentals Tool")
+    workflow.add_edge("Fundamentals Tool", END)
+    return workflow.compile()
+
+
+def test_tool_calls_hit_prefetched_data(counted_sources):
+    """The analyst's tool call after the prefetch node does not touch the data again."""
+    seen = []
+    graph = build_graph(seen)
+    state = {"company_of_interest": "AAPL", "trade_date": "2024-05-10", "fundamentals_report": ""}
+
+    with run_cache() as cache:
+        final_state = graph.invoke(state)
+
+    prefetched = [call for call in counted_sources if call[0] == "insider_senti"]
+    assert prefetched == [("insider_senti", "AAPL", "2024-05-10")]
+    assert ("simfin", "us-income-quarterly.csv") in counted_sources
+    assert seen == [cache]
+    assert cache.hits == 1
+    assert final_state["fundamentals_report"].startswith("## AAPL Insider Sentiment Data")
+    print("✓ Tool calls hit the prefetched data")
+
+
+def test_runs_are_isolated(counted_sources):
+    """Each run gets a fresh cache and nothing is cached outside a run."""
+    graph = build_graph([])
+    state = {"company_of_interest": "NVDA", "trade_date": "2024-05-10", "fundamentals_report": ""}
+
+    for _ in range(2):
+        with run_cache():
+            graph.invoke(state)
+    assert [c for c in counted_sources if c[0] == "insider_senti"] == [
+        ("insider_senti", "NVDA", "2024-05-10")
+    ] * 2
+
+    interface.get_finnhub_company_insider_sentiment("NVDA", "2024-05-10", 30)
+    interface.get_finnhub_company_insider_sentiment("NVDA", "2024-05-10", 30)
+    assert len([c for c in counted_sources if c[0] == "insider_senti"]) == 4
+    print("✓ Runs are isolated")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
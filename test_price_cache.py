@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental online price cache.
+
+This script tests:
+1. The first load downloads the full history
+2. Later days only fetch the missing tail and merge it
+3. Repeated loads on the same day do not hit the downloader
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.price_cache import HISTORY_YEARS, load_price_history
+
+
+class FakeDownloader:
+    """Stand-in for yf.download serving business-day bars from a fixed series."""
+
+    def __init__(self):
+        self.calls = []
+        dates = pd.bdate_range("2005-01-03", "2026-12-31")
+        self.bars = pd.DataFrame(
+            {
+                "Close": np.linspace(10, 500, len(dates)),
+                "High": np.linspace(11, 501, len(dates)),
+                "Low": np.linspace(9, 499, len(dates)),
+                "Open": np.linspace(10, 500, len(dates)),
+                "Volume": np.arange(len(dates)) + 1000,
+            },
+            index=pd.DatetimeIndex(dates, name="Date"),
+        )
+
+    def __call__(self, symbol, start, end, **kwargs):
+        self.calls.append((symbol, start, end))
+        # yf.download treats end as exclusive
+        return self.bars[(self.bars.index >= start) & (self.bars.index < end)]
+
+
+def test_first_load_downloads_full_history(tmp_path):
+    """A cold cache downloads HISTORY_YEARS of bars once."""
+    downloader = FakeDownloader()
+    today = pd.Timestamp("2024-05-10")
+
+    history = load_price_history("TEST", str(tmp_path), downloader, today=today)
+
+    assert len(downloader.calls) == 1
+    assert downloader.calls[0][1] == (today - pd.DateOffset(years=HISTORY_YEARS)).strftime("%Y-%m-%d")
+    assert history["Date"].max() == pd.Timestamp("2024-05-09")
+    print("✓ Cold cache downloads full history")
+
+
+def test_next_day_fetches_only_tail(tmp_path):
+    """A later day only requests the bars after the last cached one."""
+    downloader = FakeDownloader()
+    load_price_history("TEST", str(tmp_path), downloader, today=pd.Timestamp("2024-05-10"))
+
+    history = load_price_history(
+        "TEST", str(tmp_path), downloader, today=pd.Timestamp("2024-05-15")
+    )
+
+    assert downloader.calls[-1] == ("TEST", "2024-05-10", "2024-05-15")
+    expected = downloader(
+        "TEST", start="2009-05-10", end="2024-05-15"
+    ).reset_index()
+    pd.testing.assert_frame_equal(history, expected, check_freq=False)
+    assert history["Date"].is_unique
+
+    files = sorted(os.listdir(tmp_path))
+    assert files == ["TEST-YFin-history.csv", "TEST-YFin-history.json"]
+    print("✓ Next day fetches only the tail")
+
+
+def test_same_day_reuses_cache(tmp_path):
+    """Loading twice on the same day downloads nothing the second time."""
+    downloader = FakeDownloader()
+    today = pd.Timestamp("2024-05-11")  # a Saturday, so the tail fetch is empty
+    load_price_history("TEST", str(tmp_path), downloader, today=today)
+    load_price_history("TEST", str(tmp_path), downloader, today=pd.Timestamp("2024-05-12"))
+    calls = len(downloader.calls)
+
+    load_price_history("TEST", str(tmp_path), downloader, today=pd.Timestamp("2024-05-12"))
+    assert len(downloader.calls) == calls
+    print("✓ Same day reuses cache")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
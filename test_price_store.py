@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar YFin price store.
+
+This script tests:
+1. Date range slices match filtering the CSV with pandas
+2. The full frame matches the CSV
+3. The store is rebuilt when the source CSV changes
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows.price_store import PriceStore, YFIN_CSV_TEMPLATE
+
+
+def write_price_csv(price_dir, symbol="TEST", start="2023-01-02", periods=300, seed=0):
+    """Write a synthetic YFin-style CSV and return its path."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    data = pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.003, periods)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Adj Close": close * 0.98,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+        }
+    )
+    path = os.path.join(price_dir, YFIN_CSV_TEMPLATE.format(symbol=symbol))
+    data.to_csv(path, index=False)
+    return path
+
+
+def legacy_range(csv_path, start_date, end_date):
+    data = pd.read_csv(csv_path)
+    data["DateOnly"] = data["Date"].str[:10]
+    filtered = data[(data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)]
+    return filtered.drop("DateOnly", axis=1)
+
+
+def test_range_matches_csv_filter(tmp_path):
+    """Slices served from the store match the old read_csv filtering, index included."""
+    csv_path = write_price_csv(str(tmp_path))
+    store = PriceStore(str(tmp_path), store_dir=str(tmp_path / "store"))
+
+    for start_date, end_date in [
+        ("2023-01-02", "2023-02-15"),
+        ("2023-03-04", "2023-03-05"),  # weekend only
+        ("2022-01-01", "2030-01-01"),
+        ("2023-06-01", "2023-05-01"),  # inverted range
+    ]:
+        expected = legacy_range(csv_path, start_date, end_date)
+        actual = store.get_range("TEST", start_date, end_date)
+        pd.testing.assert_frame_equal(actual, expected, check_index_type=False)
+        assert actual.to_string() == expected.to_string()
+
+    print("✓ Range slices match CSV filtering")
+
+
+def test_full_frame_matches_csv(tmp_path):
+    """The full frame equals the parsed CSV."""
+    csv_path = write_price_csv(str(tmp_path))
+    store = PriceStore(str(tmp_path), store_dir=str(tmp_path / "store"))
+
+    pd.testing.assert_frame_equal(
+        store.get_frame("TEST"), pd.read_csv(csv_path), check_index_type=False
+    )
+    assert store.load("TEST").contains("2023-01-02")
+    assert not store.load("TEST").contains("2023-01-07")
+    print("✓ Full frame matches CSV")
+
+
+def test_store_refreshes_when_csv_changes(tmp_path):
+    """A rewritten CSV is re-ingested and the old columnar copy is removed."""
+    write_price_csv(str(tmp_path), periods=50)
+    store = PriceStore(str(tmp_path), store_dir=str(tmp_path / "store"))
+    assert len(store.load("TEST")) == 50
+
+    csv_path = write_price_csv(str(tmp_path), periods=80, seed=1)
+    os.utime(csv_path, ns=(0, os.stat(csv_path).st_mtime_ns + 1_000_000))
+    assert len(store.load("TEST")) == 80
+    assert len(os.listdir(tmp_path / "store")) == 1
+
+    with pytest.raises(FileNotFoundError):
+        store.load("MISSING")
+    print("✓ Store refreshes on CSV change")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
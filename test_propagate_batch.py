@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for running the graph over several tickers at once.
+
+This script tests, with a stand-in graph that calls cached dataflows:
+1. Runs overlap, share data common to all tickers and yield as they complete
+2. Each ticker gets its own state, signal and log file
+3. A failing ticker is reported without stopping the others
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.dataflows.run_cache import run_cached
+
+DELAY = 0.3
+calls = []
+calls_lock = threading.Lock()
+# set by a test to hold the runs: every run waits at the barrier, and all but the one named
+# first wait for the first result to be yielded
+gates = {"barrier": None, "first": None, "first_yielded": None}
+
+
+@run_cached
+def global_news(curr_date):
+    with calls_lock:
+        calls.append(("global", curr_date))
+    time.sleep(DELAY)
+    return f"world news {curr_date}"
+
+
+@run_cached
+def stock_news(ticker, curr_date):
+    with calls_lock:
+        calls.append((ticker, curr_date))
+    if ticker == "FAIL":
+        raise ConnectionError("no news for FAIL")
+    if gates["barrier"] is None:
+        time.sleep(DELAY)
+    else:
+        gates["barrier"].wait(timeout=30)
+        if ticker != gates["first"]:
+            gates["first_yielded"].wait(timeout=30)
+    return f"{ticker} news {curr_date}"
+
+
+def analyst(state):
+    ticker, date = state["company_of_interest"], state["trade_date"]
+    report = f"{global_news(date)} / {stock_news(ticker, date)}"
+    debate = {"bull_history": "", "bear_history": "", "history": "", "current_response": "", "judge_decision": ""}
+    risk = {"risky_history": "", "safe_history": "", "neutral_history": "", "history": "", "judge_decision": ""}
+    return {
+        "market_report": report,
+        "investment_debate_state": debate,
+        "trader_investment_plan": "",
+        "risk_debate_state": risk,
+        "investment_plan": "",
+        "final_trade_decision": f"BUY {ticker}",
+    }
+
+
+class EchoSignalProcessor:
+    def process_signal(self, full_signal):
+        return full_signal.split()[0]
+
+
+@pytest.fixture
+def trading_graph(make_trading_graph, fake_llm):
+    """A TradingAgentsGraph running the stand-in graph instead of the agents."""
+    calls.clear()
+    gates.update(barrier=None, first=None, first_yielded=None)
+    workflow = StateGraph(AgentState)
+    workflow.add_node("Analyst", analyst)
+    workflow.add_edge(START, "Analyst")
+    workflow.add_edge("Analyst", END)
+
+    ta = make_trading_graph(fake_llm(), config={"batch_max_concurrency": 4})
+    ta.signal_processor = EchoSignalProcessor()
+    ta.graph = workflow.compile()
+    return ta
+
+
+def test_batch_runs_concurrently_and_shares_data(trading_graph):
+    """All four runs are in flight at once, fetch the global data once and yield as they end."""
+    tickers = ["A", "BB", "CCC", "DDDD"]
+    # the runs only get past the barrier if all four are running; the last one submitted
+    # finishes first, and the others only once its result is out
+    gates.update(barrier=threading.Barrier(4), first="DDDD", first_yielded=threading.Event())
+    results = []
+    for result in trading_graph.propagate_batch(tickers, "2024-05-10"):
+        results.append(result)
+        gates["first_yielded"].set()
+
+    assert [signal for _, _, signal in results] == ["BUY"] * 4
+    assert sorted(ticker for ticker, _, _ in results) == sorted(tickers)
+    assert [ticker for ticker, _, _ in results][0] == "DDDD"
+    assert calls.count(("global", "2024-05-10")) == 1
+    assert sorted(c for c in calls if c[0] != "global") == [(t, "2024-05-10") for t in tickers]
+    print("✓ Four tickers in flight at once")
+
+
+def test_batch_isolates_runs(trading_graph):
+    """Every ticker gets its own state, signal and log file."""
+    tickers = ["AAPL", "NVDA", "MSFT"]
+    results = {t: (state, signal) for t, state, signal in trading_graph.propagate_batch(tickers, "2024-05-10", 2)}
+
+    for ticker in tickers:
+        state, signal = results[ticker]
+        assert state["company_of_interest"] == ticker
+        assert state["market_report"] == f"world news 2024-05-10 / {ticker} news 2024-05-10"
+        assert signal == "BUY"
+        path = f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_2024-05-10.json"
+        with open(path) as f:
+            log = json.load(f)
+        assert log["2024-05-10"]["company_of_interest"] == ticker
+    assert calls.count(("global", "2024-05-10")) == 1
+    print("✓ Runs are isolated")
+
+
+def test_batch_reports_failures(trading_graph):
+    """The first ticker to finish fails; the others still complete and are yielded."""
+    tickers = ["AAPL", "FAIL", "NVDA", "MSFT"]
+    results = {t: (state, outcome) for t, state, outcome in trading_graph.propagate_batch(tickers, "2024-05-10")}
+
+    assert sorted(results) == sorted(tickers)
+    state, error = results.pop("FAIL")
+    assert state is None
+    assert isinstance(error, ConnectionError)
+    assert all(signal == "BUY" for _, signal in results.values())
+    assert not os.path.exists("eval_results/FAIL")
+    print("✓ Failures are reported per ticker")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-day byte-offset index of the Reddit data.
+
+This script tests:
+1. Indexed fetches return exactly what a full scan of the files returns
+2. The range API matches one fetch per day
+3. The compiled company matcher and multi-ticker tagging match the per-term searches
+4. Index files are kept out of the category folders and rebuilt when a file changes
+5. The Reddit news tools give the same output as the day-by-day loop
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import interface, reddit_utils
+from tradingagents.dataflows.reddit_utils import (
+    fetch_top_from_category,
+    company_matcher,
+    fetch_top_for_tickers,
+    fetch_top_from_category_range,
+    ticker_to_company,
+)
+
+
+def scan_top_from_category(category, date, max_limit, query=None, data_path="reddit_data"):
+    """The original full-scan fetch."""
+    num_files = len(os.listdir(os.path.join(data_path, category)))
+    limit_per_subreddit = max_limit // num_files
+    all_content = []
+    for data_file in os.listdir(os.path.join(data_path, category)):
+        if not data_file.endswith(".jsonl"):
+            continue
+        posts = []
+        with open(os.path.join(data_path, category, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(parsed_line["created_utc"]).strftime("%Y-%m-%d")
+                if post_date != date:
+                    continue
+                if "company" in category and query:
+                    terms = ticker_to_company[query].split(" OR ") + [query]
+                    if not any(
+                        re.search(t, parsed_line["title"], re.IGNORECASE)
+                        or re.search(t, parsed_line["selftext"], re.IGNORECASE)
+                        for t in terms
+                    ):
+                        continue
+                posts.append(
+                    {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": post_date,
+                    }
+                )
+        posts.sort(key=lambda x: x["upvotes"], reverse=True)
+        all_content.extend(posts[:limit_per_subreddit])
+    return all_content
+
+
+def write_subreddits(data_path, category, seed=0):
+    rng = np.random.default_rng(seed)
+    words = ["Apple", "earnings", "Nvidia", "AAPL", "market", "Fed", "Meta", "facebook", "rates"]
+    start = datetime(2024, 5, 1).timestamp()
+    os.makedirs(os.path.join(data_path, category), exist_ok=True)
+    for name in ("stocks", "investing", "wallstreetbets"):
+        with open(os.path.join(data_path, category, f"{name}.jsonl"), "w") as f:
+            for i in range(400):
+                post = {
+                    "created_utc": start + float(rng.integers(0, 14 * 86400)),
+                    "title": " ".join(rng.choice(words, 3)),
+                    "selftext": "" if i % 3 else " ".join(rng.choice(words, 5)),
+                    "url": f"https://reddit.com/{name}/{i}",
+                    "ups": int(rng.integers(0, 100)),
+                }
+                f.write(json.dumps(post) + "\n")
+                if i % 50 == 0:
+                    f.write("\n")
+
+
+@pytest.fixture
+def reddit_data(tmp_path, monkeypatch):
+    data_path = str(tmp_path / "reddit_data")
+    write_subreddits(data_path, "global_news")
+    write_subreddits(data_path, "company_news", seed=1)
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(reddit_utils, "get_config", lambda: {"data_cache_dir": cache_dir})
+    return data_path
+
+
+def test_matches_full_scan(reddit_data):
+    """Indexed single-day fetches equal the full scan."""
+    for day in range(16):
+        date = (datetime(2024, 4, 30) + timedelta(days=day)).strftime("%Y-%m-%d")
+        assert fetch_top_from_category("global_news", date, 9, data_path=reddit_data) == (
+            scan_top_from_category("global_news", date, 9, data_path=reddit_data)
+        )
+        for query in ("AAPL", "META"):
+            assert fetch_top_from_category(
+                "company_news", date, 6, query, data_path=reddit_data
+            ) == scan_top_from_category("company_news", date, 6, query, data_path=reddit_data)
+    print("✓ Indexed fetches match the full scan")
+
+
+def test_range_matches_daily_fetches(reddit_data):
+    """One range fetch returns the same posts as a fetch per day."""
+    posts = fetch_top_from_category_range(
+        "company_news", "2024-05-03", "2024-05-10", 12, "AAPL", data_path=reddit_data
+    )
+    assert list(posts) == [f"2024-05-{d:02d}" for d in range(3, 11)]
+    for date, day_posts in posts.items():
+        assert day_posts == scan_top_from_category(
+            "company_news", date, 12, "AAPL", data_path=reddit_data
+        )
+    print("✓ Range fetch matches daily fetches")
+
+
+def test_company_matcher():
+    """The alternation regex agrees with searching each term separately."""
+    texts = ["snap income", "SNAP INC. results", "Johnson & Johnson", "jnj", "facebook ads", "X marks", ""]
+    for ticker in ticker_to_company:
+        terms = ticker_to_company[ticker].split(" OR ") + [ticker]
+        for text in texts:
+            expected = any(re.search(term, text, re.IGNORECASE) for term in terms)
+            assert bool(company_matcher(ticker).search(text)) == expected, (ticker, text)
+    assert company_matcher("AAPL") is company_matcher("AAPL")
+    print("✓ Compiled matcher agrees with per-term searches")
+
+
+def test_multi_ticker_tagging(reddit_data):
+    """One tagging pass returns the same posts as a range fetch per ticker."""
+    tickers = ["AAPL", "NVDA", "META"]
+    tagged = fetch_top_for_tickers(
+        "company_news", tickers, "2024-05-01", "2024-05-07", 12, data_path=reddit_data
+    )
+    assert list(tagged) == tickers
+    for ticker in tickers:
+        assert tagged[ticker] == fetch_top_from_category_range(
+            "company_news", "2024-05-01", "2024-05-07", 12, ticker, data_path=reddit_data
+        )
+    print("✓ Multi-ticker tagging matches per-ticker fetches")
+
+
+def test_index_location_and_refresh(reddit_data):
+    """Indexes never land in the category folder and follow changes to the data."""
+    fetch_top_from_category("global_news", "2024-05-02", 9, data_path=reddit_data)
+    assert sorted(os.listdir(os.path.join(reddit_data, "global_news"))) == [
+        "investing.jsonl",
+        "stocks.jsonl",
+        "wallstreetbets.jsonl",
+    ]
+
+    with open(os.path.join(reddit_data, "global_news", "stocks.jsonl"), "a") as f:
+        post = {
+            "created_utc": datetime(2024, 5, 2, 12).timestamp(),
+            "title": "late post",
+            "selftext": "",
+            "url": "https://reddit.com/late",
+            "ups": 10_000,
+        }
+        f.write(json.dumps(post) + "\n")
+
+    posts = fetch_top_from_category("global_news", "2024-05-02", 9, data_path=reddit_data)
+    assert posts == scan_top_from_category("global_news", "2024-05-02", 9, data_path=reddit_data)
+    assert any(post["title"] == "late post" for post in posts)
+    print("✓ Indexes are stored outside the data and refreshed")
+
+
+def daily_loop_news(category, start_date, look_back_days, max_limit_per_day, data_path, ticker=None):
+    """The original look-back loop: one full scan per day."""
+    start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    before = (start_date - timedelta(days=look_back_days)).strftime("%Y-%m-%d")
+    posts = []
+    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    while curr_date <= start_date:
+        posts.extend(
+            scan_top_from_category(
+                category, curr_date.strftime("%Y-%m-%d"), max_limit_per_day, ticker, data_path=data_path
+            )
+        )
+        curr_date += timedelta(days=1)
+    if len(posts) == 0:
+        return ""
+    news_str = ""
+    for post in posts:
+        if post["content"] == "":
+            news_str += f"### {post['title']}\n\n"
+        else:
+            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+    if ticker:
+        return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
+    return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
+
+
+def test_news_tools_match_daily_loop(reddit_data, monkeypatch):
+    """One pass over the window renders exactly what eight daily scans did."""
+    monkeypatch.setattr(interface, "DATA_DIR", os.path.dirname(reddit_data))
+    for start_date in ("2024-05-03", "2024-05-09", "2024-05-20"):
+        assert interface.get_reddit_global_news(start_date, 7, 5) == daily_loop_news(
+            "global_news", start_date, 7, 5, reddit_data
+        )
+        assert interface.get_reddit_company_news("AAPL", start_date, 7, 5) == daily_loop_news(
+            "company_news", start_date, 7, 5, reddit_data, ticker="AAPL"
+        )
+    assert interface.get_reddit_global_news("2024-06-30", 7, 5) == ""
+    print("✓ Reddit news tools match the daily loop")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent cache of the OpenAI web-search tools.
+
+This script tests, against a local fake OpenAI endpoint:
+1. Repeated tool calls for the same ticker, date and model hit the cache
+2. Different tools, tickers, dates and models are cached separately
+3. Entries expire after the TTL and the cache evicts least recently used entries
+4. The cache defaults to the configured limits and closes every connection it opens
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.response_cache import ResponseCache
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+class FakeOpenAI:
+    """Serves /v1/responses with a web search call followed by a message echoing the prompt."""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.requests.append(body)
+                prompt = body["input"][0]["content"][0]["text"]
+                payload = json.dumps(
+                    {
+                        "id": f"resp_{len(server.requests)}",
+                        "object": "response",
+                        "created_at": 0,
+                        "model": body["model"],
+                        "status": "completed",
+                        "output": [
+                            {"type": "web_search_call", "id": "ws_1", "status": "completed"},
+                            {
+                                "type": "message",
+                                "id": "msg_1",
+                                "role": "assistant",
+                                "status": "completed",
+                                "content": [
+                                    {
+                                        "type": "output_text",
+                                        "text": f"[{body['model']}] {prompt}",
+                                        "annotations": [],
+                                    }
+                                ],
+                            },
+                        ],
+                        "parallel_tool_calls": True,
+                        "tool_choice": "auto",
+                        "tools": [],
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_openai(tmp_path, monkeypatch):
+    server = FakeOpenAI()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    previous = interface.get_config()
+    set_config(
+        {
+            "backend_url": server.url,
+            "quick_think_llm": "fake-model",
+            "data_cache_dir": str(tmp_path),
+            "response_cache_ttl_seconds": 3600,
+            "response_cache_max_entries": 100,
+        }
+    )
+    yield server
+    set_config(previous)
+    server.close()
+
+
+def test_repeated_calls_hit_cache(fake_openai):
+    """The second call for the same ticker and date is served from the cache."""
+    first = interface.get_stock_news_openai("AAPL", "2024-05-10")
+    second = interface.get_stock_news_openai("AAPL", "2024-05-10")
+    assert first == second
+    assert first.startswith("[fake-model] Can you search Social Media for AAPL")
+    assert len(fake_openai.requests) == 1
+    print("✓ Repeated calls hit the cache")
+
+
+def test_keys_are_separate(fake_openai):
+    """Tool, ticker, date and model all take part in the key."""
+    interface.get_stock_news_openai("AAPL", "2024-05-10")
+    interface.get_fundamentals_openai("AAPL", "2024-05-10")
+    interface.get_stock_news_openai("NVDA", "2024-05-10")
+    interface.get_stock_news_openai("AAPL", "2024-05-11")
+    interface.get_global_news_openai("2024-05-10")
+    set_config({"quick_think_llm": "other-model"})
+    interface.get_stock_news_openai("AAPL", "2024-05-10")
+    assert len(fake_openai.requests) == 6
+
+    interface.get_global_news_openai("2024-05-10")
+    set_config({"quick_think_llm": "fake-model"})
+    interface.get_global_news_openai("2024-05-10")
+    interface.get_fundamentals_openai("AAPL", "2024-05-10")
+    assert len(fake_openai.requests) == 7
+    print("✓ Cache keys are separate")
+
+
+def test_ttl_and_eviction(tmp_path):
+    """Expired entries are dropped and the least recently used ones are evicted."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=0.2, max_entries=3)
+    cache.set("tool", "AAPL", "2024-05-10", "m", "old")
+    time.sleep(0.3)
+    assert cache.get("tool", "AAPL", "2024-05-10", "m") is None
+
+    cache.ttl_seconds = 3600
+    for ticker in ("A", "B", "C"):
+        cache.set("tool", ticker, "2024-05-10", "m", ticker)
+        time.sleep(0.01)
+    assert cache.get("tool", "A", "2024-05-10", "m") == "A"
+    cache.set("tool", "D", "2024-05-10", "m", "D")
+
+    assert len(cache) == 3
+    assert cache.get("tool", "B", "2024-05-10", "m") is None
+    assert cache.get("tool", "A", "2024-05-10", "m") == "A"
+    print("✓ TTL expiry and LRU eviction")
+
+
+def test_defaults_and_connections(tmp_path, monkeypatch):
+    """Limits default to the default config, and no connection is left open."""
+    connections = []
+    sqlite_connect = sqlite3.connect
+
+    def connect(*args, **kwargs):
+        conn = sqlite_connect(*args, **kwargs)
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", connect)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    assert cache.ttl_seconds == DEFAULT_CONFIG["response_cache_ttl_seconds"]
+    assert cache.max_entries == DEFAULT_CONFIG["response_cache_max_entries"]
+
+    cache.set("tool", "AAPL", "2024-05-10", "m", "value")
+    assert cache.get("tool", "AAPL", "2024-05-10", "m") == "value"
+    assert len(cache) == 1
+    assert len(connections) == 4
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    print("✓ Defaults match the config and connections are closed")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight coalescing of dataflow fetches.
+
+This script tests:
+1. Concurrent threads asking for the same key share one call and its result or exception
+2. Concurrent online price history loads download once
+3. Concurrent online price range fetches download once
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.price_cache import load_price_history
+from tradingagents.dataflows.singleflight import SingleFlight
+
+
+def test_threads_share_one_call():
+    """Eight threads, one execution, one shared result; the next call runs again."""
+    group = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return {"price": 1}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: group.do("AAPL", fetch), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    group.do("AAPL", fetch)
+    assert len(calls) == 2
+    print("✓ Threads share one call")
+
+
+def test_threads_share_exception():
+    """A failing call raises in every waiter."""
+    group = SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise ConnectionError("upstream down")
+
+    def call(_):
+        try:
+            group.do("NVDA", fail)
+        except ConnectionError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(call, range(4))) == ["upstream down"] * 4
+    print("✓ Exceptions are shared")
+
+
+def test_concurrent_price_history_downloads_once(tmp_path):
+    """A burst of online price loads for one symbol triggers a single download."""
+    downloads = []
+
+    def downloader(symbol, start, end, **kwargs):
+        downloads.append(symbol)
+        time.sleep(0.3)
+        dates = pd.bdate_range("2024-01-02", "2024-05-09", name="Date")
+        return pd.DataFrame({"Close": range(len(dates))}, index=dates)
+
+    today = pd.Timestamp("2024-05-10")
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        frames = list(
+            executor.map(
+                lambda _: load_price_history("AAPL", str(tmp_path), downloader, today=today),
+                range(6),
+            )
+        )
+
+    assert downloads == ["AAPL"]
+    assert len({id(frame) for frame in frames}) == 6
+    assert all(frame.equals(frames[0]) for frame in frames)
+    print("✓ Concurrent price loads download once")
+
+
+def test_concurrent_online_range_fetches_once(monkeypatch):
+    """A burst of online price range requests for one symbol triggers a single download."""
+    downloads = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def history(self, start, end):
+            downloads.append((self.symbol, start, end))
+            time.sleep(0.3)
+            dates = pd.bdate_range(start, end, inclusive="left", name="Date", tz="America/New_York")
+            return pd.DataFrame({"Open": 1.234, "Close": 2.345}, index=dates)
+
+    monkeypatch.setattr(interface.yf, "Ticker", FakeTicker)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        reports = list(
+            executor.map(
+                lambda _: interface.get_YFin_data_online("aapl", "2024-05-01", "2024-05-10"),
+                range(6),
+            )
+        )
+
+    assert downloads == [("AAPL", "2024-05-01", "2024-05-10")]
+    assert all(report.splitlines()[4:] == reports[0].splitlines()[4:] for report in reports)
+    assert "2024-05-09,1.23,2.35" in reports[0]
+    print("✓ Concurrent price range fetches download once")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
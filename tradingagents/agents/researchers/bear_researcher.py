@@ -37,8 +37,6 @@ def create_bear_researcher(llm, memory):
 Resources: Market={market_research_report}, News={news_report}, Bull={current_response}
 
 Emojis heavy. Numbers only. Make it stark! ⚠️"""
-Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
-"""
 
         response = llm.invoke(prompt)
 
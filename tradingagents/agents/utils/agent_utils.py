@@ -5,6 +5,8 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import RemoveMessage
 from langchain_core.tools import tool
 from datetime import date, timedelta, datetime
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import functools
 import pandas as pd
 import os
@@ -31,6 +33,73 @@ def create_msg_delete():
     return delete_messages
 
 
+# Indicators the market analyst reports on, warmed by the prefetch stage
+PREFETCH_INDICATORS = ["close_50_sma", "close_200_sma", "close_10_ema", "macd", "rsi", "boll"]
+
+
+def prefetch_calls(ticker, curr_date, selected_analysts, online):
+    """The dataflow calls the selected analysts' tools make with predictable arguments."""
+    calls = []
+    if "market" in selected_analysts:
+        for indicator in PREFETCH_INDICATORS:
+            calls.append(
+                (interface.get_stock_stats_indicators_window, (ticker, indicator, curr_date, 30, online))
+            )
+    if "social" in selected_analysts:
+        if online:
+            calls.append((interface.get_stock_news_openai, (ticker, curr_date)))
+        else:
+            calls.append((interface.get_reddit_company_news, (ticker, curr_date, 7, 5)))
+    if "news" in selected_analysts:
+        if online:
+            calls.append((interface.get_global_news_openai, (curr_date,)))
+        else:
+            calls.append((interface.get_reddit_global_news, (curr_date, 7, 5)))
+    if "fundamentals" in selected_analysts:
+        if online:
+            calls.append((interface.get_fundamentals_openai, (ticker, curr_date)))
+        else:
+            calls.append((interface.get_finnhub_company_insider_sentiment, (ticker, curr_date, 30)))
+            calls.append((interface.get_finnhub_company_insider_transactions, (ticker, curr_date, 30)))
+            for freq in ("annual", "quarterly"):
+                calls.append((interface.get_simfin_balance_sheet, (ticker, freq, curr_date)))
+                calls.append((interface.get_simfin_cashflow, (ticker, freq, curr_date)))
+                calls.append((interface.get_simfin_income_statements, (ticker, freq, curr_date)))
+    return calls
+
+
+def create_data_prefetch(toolkit, selected_analysts, max_workers=8):
+    def data_prefetch(state):
+        """Concurrently warm the data the analysts will ask for into the run cache"""
+        calls = prefetch_calls(
+            state["company_of_interest"],
+            state["trade_date"],
+            selected_analysts,
+            toolkit.config["online_tools"],
+        )
+
+        def run(call):
+            func, args = call
+            try:
+                func(*args)
+            except Exception as e:
+                # the analyst's own tool call will surface the error
+                print(f"Prefetch of {func.__name__}{args} failed: {e}")
+
+        # each task runs in a copy of this node's context so it sees the run's cache
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, run, call)
+                for call in calls
+            ]
+            for future in futures:
+                future.result()
+
+        return {}
+
+    return data_prefetch
+
+
 class Toolkit:
     _config = DEFAULT_CONFIG.copy()
 
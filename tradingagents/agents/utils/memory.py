@@ -1,7 +1,45 @@
-import chromadb
-from chromadb.config import Settings
+import hashlib
+import os
+import threading
+import uuid
+
 from openai import OpenAI
 
+from tradingagents.dataflows.run_cache import current_run_cache
+
+from .vector_index import get_vector_index
+
+# Texts sent in one embeddings request by add_situations
+EMBEDDING_BATCH_SIZE = 256
+
+_chroma_clients = {}
+_chroma_clients_lock = threading.Lock()
+
+
+def get_chroma_client(memory_dir=None):
+    """Return the process-wide Chroma client for a memory directory (in-memory if None).
+
+    Chroma's persistent client is not safe to share between processes: a long-lived client
+    keeps serving its own HNSW index and does not see rows added by another process. Workers
+    sharing a memory directory use the numpy backend instead.
+    """
+    # Chroma is only imported when the chroma backend is used
+    import chromadb
+    from chromadb.config import Settings
+
+    key = os.path.abspath(memory_dir) if memory_dir else None
+    with _chroma_clients_lock:
+        client = _chroma_clients.get(key)
+        if client is None:
+            settings = Settings(allow_reset=True, anonymized_telemetry=False)
+            if key is None:
+                client = chromadb.Client(settings)
+            else:
+                os.makedirs(key, exist_ok=True)
+                client = chromadb.PersistentClient(path=key, settings=settings)
+            _chroma_clients[key] = client
+        return client
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -10,16 +48,55 @@ class FinancialSituationMemory:
         else:
             self.embedding = "text-embedding-3-small"
         self.client = OpenAI(base_url=config["backend_url"])
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+        # lessons persist in config["memory_dir"]; graphs and workers using the same
+        # directory share one client (or index) per process and the same named collections
+        backend = config.get("memory_backend", "numpy")
+        if backend == "chroma":
+            self.chroma_client = get_chroma_client(config.get("memory_dir"))
+            self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
+        elif backend == "numpy":
+            self.situation_collection = get_vector_index(
+                config.get("memory_dir"), name, config.get("memory_index_dtype", "float32")
+            )
+        else:
+            raise ValueError(f"Unsupported memory backend: {backend}")
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        """Get OpenAI embedding for a text, requested once per run for identical texts"""
+        # the run cache is shared by every memory, so the researchers, managers and trader
+        # looking up the same situation in one run cost a single embeddings request
+        cache = current_run_cache()
+        if cache is None:
+            return self._embed([text])[0]
+        return cache.get_or_compute(self._cache_key(text), lambda: self._embed([text])[0])
+
+    def get_embeddings(self, texts):
+        """Get OpenAI embeddings for several texts in batched requests"""
+        cache = current_run_cache()
+        unique_texts = list(dict.fromkeys(texts))
+        if cache is not None:
+            missing = [text for text in unique_texts if self._cache_key(text) not in cache]
+        else:
+            missing = unique_texts
+
+        embeddings = {}
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            batch = missing[start : start + EMBEDDING_BATCH_SIZE]
+            embeddings.update(zip(batch, self._embed(batch)))
+
+        if cache is not None:
+            for text in unique_texts:
+                embeddings[text] = cache.get_or_compute(
+                    self._cache_key(text), lambda text=text: embeddings[text]
+                )
+        return [embeddings[text] for text in texts]
+
+    def _cache_key(self, text):
+        return ("embedding", self.embedding, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+    def _embed(self, texts):
+        response = self.client.embeddings.create(model=self.embedding, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
@@ -27,15 +104,14 @@ class FinancialSituationMemory:
         situations = []
         advice = []
         ids = []
-        embeddings = []
 
-        offset = self.situation_collection.count()
-
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
+        for situation, recommendation in situations_and_advice:
             situations.append(situation)
             advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+            # random ids, so concurrent writers to a shared collection never collide
+            ids.append(uuid.uuid4().hex)
+
+        embeddings = self.get_embeddings(situations)
 
         self.situation_collection.add(
             documents=situations,
@@ -0,0 +1,243 @@
+import json
+import os
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: indexes are only safe to share within one process
+    fcntl = None
+
+
+class VectorIndex:
+    """
+    Compact nearest-neighbour index of unit-normalized embeddings in a NumPy matrix.
+
+    Top-k search is one matrix-vector product over the memory-mapped matrix. With dtype
+    "int8" every row is stored as int8 with a per-row scale, a quarter of the float32 size.
+
+    It implements the part of the Chroma collection API FinancialSituationMemory uses (add,
+    query, get, count), and reports distances in Chroma's default space (squared L2, which
+    for unit vectors is 2 - 2 * cosine), so similarity scores match the Chroma backend.
+
+    On disk an index is a JSON file with the documents, metadatas and ids plus the .npy
+    files of one version of the matrix. A write saves a new version and then atomically
+    replaces the JSON file, so readers in other processes always see a complete index and
+    pick up new versions on their next query. Writers hold an exclusive lock on the index's
+    .lock file from reading the current version to replacing it, so concurrent workers
+    never lose each other's rows, and readers hold a shared lock while loading a version,
+    so its files are not removed under them.
+    """
+
+    def __init__(self, directory: Optional[str], name: str, dtype: str = "float32"):
+        if dtype not in ("float32", "int8"):
+            raise ValueError(f"Unsupported vector index dtype: {dtype}")
+        self.directory = directory
+        self.name = name
+        self.dtype = dtype
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._records = {"version": None, "documents": [], "metadatas": [], "ids": []}
+        self._vectors: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._refresh()
+
+    @property
+    def _records_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.json")
+
+    def _matrix_path(self, version: str, part: str) -> str:
+        return os.path.join(self.directory, f"{self.name}-{version}.{part}.npy")
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Lock the index against writers in other processes (shared for readers)."""
+        if self.directory is None or fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, f"{self.name}.lock"), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _stat_stamp(self):
+        try:
+            stat = os.stat(self._records_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def _refresh(self):
+        """Reload the index if another writer replaced it on disk."""
+        if self.directory is None or self._stat_stamp() in (None, self._stamp):
+            return
+        with self._file_lock(exclusive=False):
+            self._load()
+
+    def _load(self):
+        """Load the current version; the caller holds the file lock."""
+        if self.directory is None:
+            return
+        stamp = self._stat_stamp()
+        if stamp is None or stamp == self._stamp:
+            return
+
+        with open(self._records_path, "r") as f:
+            records = json.load(f)
+        if records["dtype"] != self.dtype:
+            raise ValueError(
+                f"Vector index {self.name} is stored as {records['dtype']}, not {self.dtype}"
+            )
+        version = records["version"]
+        self._vectors = np.load(self._matrix_path(version, "vectors"), mmap_mode="r")
+        self._scales = (
+            np.load(self._matrix_path(version, "scales"), mmap_mode="r")
+            if self.dtype == "int8"
+            else None
+        )
+        self._records = records
+        self._stamp = stamp
+
+    def _encode(self, embeddings: np.ndarray):
+        if self.dtype == "float32":
+            return embeddings.astype(np.float32), None
+        scales = np.abs(embeddings).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(embeddings / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._records["ids"])
+
+    def add(
+        self,
+        documents: Sequence[str],
+        metadatas: Sequence[Dict],
+        embeddings: Sequence[Sequence[float]],
+        ids: Sequence[str],
+    ):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        vectors, scales = self._encode(embeddings / np.where(norms == 0, 1.0, norms))
+
+        with self._lock, self._file_lock(exclusive=True):
+            self._load()
+            if self._vectors is not None:
+                vectors = np.concatenate([self._vectors, vectors])
+                if scales is not None:
+                    scales = np.concatenate([self._scales, scales])
+            records = {
+                "version": uuid.uuid4().hex,
+                "dtype": self.dtype,
+                "documents": self._records["documents"] + list(documents),
+                "metadatas": self._records["metadatas"] + list(metadatas),
+                "ids": self._records["ids"] + list(ids),
+            }
+
+            if self.directory is None:
+                self._vectors, self._scales, self._records = vectors, scales, records
+                return
+
+            version = records["version"]
+            np.save(self._matrix_path(version, "vectors"), vectors)
+            if scales is not None:
+                np.save(self._matrix_path(version, "scales"), scales)
+            tmp_path = f"{self._records_path}.tmp-{version}"
+            with open(tmp_path, "w") as f:
+                json.dump(records, f)
+            os.replace(tmp_path, self._records_path)
+            self._remove_stale_versions(version)
+            self._load()
+
+    def _remove_stale_versions(self, current: str):
+        """
+        Delete the matrix files of every version but the current one, including those left
+        by writers that died mid-write. The caller holds the exclusive file lock, so no
+        reader is between loading the JSON and mapping its matrix; readers that already
+        mapped an old version keep their open files.
+        """
+        pattern = re.compile(re.escape(self.name) + r"-([0-9a-f]{32})\.(vectors|scales)\.npy")
+        for filename in os.listdir(self.directory):
+            match = pattern.fullmatch(filename)
+            if match and match.group(1) != current:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except FileNotFoundError:
+                    pass
+
+    def _similarities(self, query: np.ndarray) -> np.ndarray:
+        if self.dtype == "int8":
+            return (self._vectors @ query) * self._scales
+        return self._vectors @ query
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 1,
+        include: Sequence[str] = ("metadatas", "documents", "distances"),
+    ) -> Dict[str, List[List]]:
+        results = {key: [] for key in ("ids", *include)}
+        with self._lock:
+            self._refresh()
+            for query in np.asarray(query_embeddings, dtype=np.float32):
+                if self._vectors is None or len(self._vectors) == 0:
+                    top = np.array([], dtype=np.int64)
+                    similarities = np.array([], dtype=np.float32)
+                else:
+                    query = query / max(float(np.linalg.norm(query)), 1e-12)
+                    similarities = self._similarities(query)
+                    k = min(n_results, len(similarities))
+                    top = np.argpartition(-similarities, k - 1)[:k]
+                    top = top[np.argsort(-similarities[top], kind="stable")]
+
+                results["ids"].append([self._records["ids"][i] for i in top])
+                if "documents" in include:
+                    results["documents"].append([self._records["documents"][i] for i in top])
+                if "metadatas" in include:
+                    results["metadatas"].append([self._records["metadatas"][i] for i in top])
+                if "distances" in include:
+                    results["distances"].append([float(2.0 - 2.0 * similarities[i]) for i in top])
+        return results
+
+    def get(self, include: Sequence[str] = ("metadatas", "documents")) -> Dict[str, List]:
+        with self._lock:
+            self._refresh()
+            results = {"ids": list(self._records["ids"])}
+            if "documents" in include:
+                results["documents"] = list(self._records["documents"])
+            if "metadatas" in include:
+                results["metadatas"] = list(self._records["metadatas"])
+            if "embeddings" in include:
+                if self._vectors is None:
+                    results["embeddings"] = np.zeros((0, 0), dtype=np.float32)
+                elif self.dtype == "int8":
+                    results["embeddings"] = self._vectors * self._scales[:, None]
+                else:
+                    results["embeddings"] = np.array(self._vectors)
+            return results
+
+
+_indexes: Dict[tuple, VectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vector_index(directory: Optional[str], name: str, dtype: str = "float32") -> VectorIndex:
+    """Return the process-wide index for a name in a memory directory (in-memory if None)."""
+    key = (os.path.abspath(directory) if directory else None, name, dtype)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = VectorIndex(key[0], name, dtype)
+            _indexes[key] = index
+        return index
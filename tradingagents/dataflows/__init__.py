@@ -1,7 +1,7 @@
 from .finnhub_utils import get_data_in_range
-from .googlenews_utils import getNewsData
+from .googlenews_utils import getNewsData, getNewsDataAsync
 from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
+from .reddit_utils import fetch_top_from_category, fetch_top_from_category_range
 from .stockstats_utils import StockstatsUtils
 from .yfin_utils import YFinanceUtils
 
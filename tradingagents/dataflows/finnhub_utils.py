@@ -1,5 +1,92 @@
 import json
 import os
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from . import singleflight
+
+# Number of parsed Finnhub files kept in memory
+FINNHUB_CACHE_SIZE = 128
+
+
+class FinnhubData:
+    """A parsed Finnhub file with its date keys sorted for range queries."""
+
+    def __init__(self, data):
+        self.data = data
+        # (date, position in the file) pairs, so results keep the order of the file
+        entries = sorted((key, pos) for pos, key in enumerate(data))
+        self.dates = [key for key, _ in entries]
+        self.positions = [pos for _, pos in entries]
+        self.keys = list(data)
+
+    def range(self, start_date, end_date):
+        lo = bisect_left(self.dates, start_date)
+        hi = bisect_right(self.dates, end_date)
+        filtered_data = {}
+        for pos in sorted(self.positions[lo:hi]):
+            key = self.keys[pos]
+            value = self.data[key]
+            if len(value) > 0:
+                filtered_data[key] = value
+        return filtered_data
+
+
+def _data_path(ticker, data_type, data_dir, period=None):
+    if period:
+        return os.path.join(
+            data_dir,
+            "finnhub_data",
+            data_type,
+            f"{ticker}_{period}_data_formatted.json",
+        )
+    return os.path.join(
+        data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+    )
+
+
+@lru_cache(maxsize=FINNHUB_CACHE_SIZE)
+def _load(ticker, data_type, period, data_dir, mtime_ns):
+    # the file's mtime is part of the key, so an updated file is parsed again
+    with open(_data_path(ticker, data_type, data_dir, period), "r") as f:
+        return FinnhubData(json.load(f))
+
+
+def load_finnhub_data(ticker, data_type, data_dir, period=None):
+    """Return the parsed Finnhub file of a ticker, from memory when it was loaded before."""
+    mtime_ns = os.stat(_data_path(ticker, data_type, data_dir, period)).st_mtime_ns
+    # concurrent cache misses of the same file parse it once
+    return singleflight.do(
+        ("finnhub", ticker, data_type, period, data_dir, mtime_ns),
+        lambda: _load(ticker, data_type, period, data_dir, mtime_ns),
+    )
+
+
+def _canonical_key(value):
+    """Hashable form of a JSON value that is equal exactly when the values compare equal."""
+    if isinstance(value, dict):
+        return frozenset((k, _canonical_key(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_canonical_key(v) for v in value)
+    return value
+
+
+def format_unique_entries(data, format_entry):
+    """
+    Format every distinct entry of a {date: [entries]} mapping once, in order of first appearance.
+    Args:
+        data (dict): Finnhub entries per date, as returned by get_data_in_range.
+        format_entry (callable): Turns one entry into its text block.
+    """
+    seen = set()
+    blocks = []
+    for entries in data.values():
+        for entry in entries:
+            key = _canonical_key(entry)
+            if key not in seen:
+                seen.add(key)
+                blocks.append(format_entry(entry))
+    return "".join(blocks)
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -13,24 +100,7 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
-
     # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    return load_finnhub_data(ticker, data_type, data_dir, period).range(
+        start_date, end_date
+    )
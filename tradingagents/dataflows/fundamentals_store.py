@@ -0,0 +1,82 @@
+import os
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class FundamentalsStore:
+    """
+    One SimFin statement file, loaded once and indexed by ticker.
+
+    Publish dates are parsed a single time and kept sorted per ticker, so "the latest report
+    published on or before a date" is a binary search instead of a scan of the whole file.
+    """
+
+    def __init__(self, csv_path: Annotated[str, "path to a SimFin bulk CSV (';' separated)"]):
+        self.csv_path = csv_path
+        df = pd.read_csv(csv_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+        self.frame = df
+
+        published = df["Publish Date"].notna().values
+        publish_ns = _to_ns(df["Publish Date"])
+        positions = np.arange(len(df))
+        codes, tickers = pd.factorize(df["Ticker"])
+
+        # rows grouped by ticker, ascending publish date; among equal publish dates the first
+        # row of the file sorts last so that it is the one picked, like idxmax would
+        keep = published & (codes >= 0)
+        order = np.lexsort((-positions[keep], publish_ns[keep], codes[keep]))
+        rows = positions[keep][order]
+        row_codes = codes[keep][order]
+        bounds = np.searchsorted(row_codes, np.arange(len(tickers) + 1))
+
+        self._index: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for i, ticker in enumerate(tickers):
+            ticker_rows = rows[bounds[i] : bounds[i + 1]]
+            self._index[ticker] = (publish_ns[ticker_rows], ticker_rows)
+
+    def latest_report(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """Return the row of the latest report published on or before curr_date, or None."""
+        entry = self._index.get(ticker)
+        if entry is None:
+            return None
+
+        publish_ns, rows = entry
+        curr_date_ns = _to_ns(pd.Series([pd.to_datetime(curr_date, utc=True).normalize()]))[0]
+        pos = int(np.searchsorted(publish_ns, curr_date_ns, side="right"))
+        if pos == 0:
+            return None
+        return self.frame.loc[rows[pos - 1]]
+
+
+def _to_ns(dates: pd.Series) -> np.ndarray:
+    return dates.dt.tz_convert(None).values.astype("datetime64[ns]").view("int64")
+
+
+_stores: Dict[str, Tuple[tuple, FundamentalsStore]] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store(
+    csv_path: Annotated[str, "path to a SimFin bulk CSV (';' separated)"],
+) -> FundamentalsStore:
+    """Return the shared FundamentalsStore of a statement file, reloading it if the file changed."""
+    stat = os.stat(csv_path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    key = os.path.abspath(csv_path)
+    with _stores_lock:
+        cached = _stores.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, FundamentalsStore(csv_path))
+            _stores[key] = cached
+        return cached[1]
@@ -1,6 +1,10 @@
+import asyncio
 import json
 import requests
+import httpx
 from bs4 import BeautifulSoup
+from parsel import Selector
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 import random
@@ -31,6 +35,174 @@ def make_request(url, headers):
     return response
 
 
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+
+def _to_search_date(date):
+    if "-" in date:
+        date = datetime.strptime(date, "%Y-%m-%d")
+        date = date.strftime("%m/%d/%Y")
+    return date
+
+
+class RateLimiter:
+    """Spaces request starts at least 1 / requests_per_second apart, across concurrent tasks."""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_start - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(now, self._next_start) + self.interval
+
+
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+async def make_request_async(client, url, rate_limiter):
+    """Make a request on a pooled client, paced by the rate limiter, with retry logic for rate limiting"""
+    await rate_limiter.wait()
+    return await client.get(url, headers=HEADERS)
+
+
+def parse_news_page(html):
+    """
+    Parse one Google News result page with parsel (lxml based).
+    Returns:
+        (list of result dicts, whether the page links to a next page)
+    """
+    selector = Selector(text=html)
+    news_results = []
+    for el in selector.css("div.SoaBEf"):
+        try:
+            fields = {
+                "link": el.css("a::attr(href)").get(),
+                "title": el.css("div.MBeuO").xpath("string()").get(),
+                "snippet": el.css(".GI74Re").xpath("string()").get(),
+                "date": el.css(".LfVVr").xpath("string()").get(),
+                "source": el.css(".NUnG9d span").xpath("string()").get(),
+            }
+            missing = [name for name, value in fields.items() if value is None]
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+            news_results.append(fields)
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    has_next = bool(selector.css("a#pnnext"))
+    return news_results, has_next
+
+
+async def getNewsDataAsync(
+    query,
+    start_date,
+    end_date,
+    max_concurrency=3,
+    requests_per_second=1.0,
+    base_url=GOOGLE_SEARCH_URL,
+    client=None,
+):
+    """
+    Scrape Google News search results like getNewsData, fetching up to max_concurrency result
+    pages at a time over one pooled HTTP client.
+    Pages are prefetched ahead of the pagination and processed in order; scraping stops at the
+    first page without results or without a "Next" link, and later prefetched pages are dropped.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    requests_per_second: float - politeness limit on request starts (0 disables it)
+    """
+    start_date = _to_search_date(start_date)
+    end_date = _to_search_date(end_date)
+    max_concurrency = max(1, max_concurrency)
+
+    own_client = client is None
+    if own_client:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency),
+            timeout=30.0,
+            follow_redirects=True,
+        )
+    rate_limiter = RateLimiter(requests_per_second)
+
+    def page_url(page):
+        offset = page * 10
+        return (
+            f"{base_url}?q={query}"
+            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+            f"&tbm=nws&start={offset}"
+        )
+
+    news_results = []
+    page = 0
+    try:
+        while True:
+            responses = await asyncio.gather(
+                *(
+                    make_request_async(client, page_url(page + i), rate_limiter)
+                    for i in range(max_concurrency)
+                ),
+                return_exceptions=True,
+            )
+
+            finished = False
+            for response in responses:
+                if isinstance(response, Exception):
+                    print(f"Failed after multiple retries: {response}")
+                    finished = True
+                    break
+
+                results_on_page, has_next = parse_news_page(response.text)
+                if not results_on_page:
+                    finished = True  # No more results found
+                    break
+
+                news_results.extend(results_on_page)
+                if not has_next:
+                    finished = True
+                    break
+
+            if finished:
+                break
+            page += max_concurrency
+    finally:
+        if own_client:
+            await client.aclose()
+
+    return news_results
+
+
+def getNewsDataConcurrent(query, start_date, end_date, **kwargs):
+    """Blocking entry point to getNewsDataAsync, usable from inside or outside an event loop."""
+    coroutine = getNewsDataAsync(query, start_date, end_date, **kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # already inside an event loop (e.g. an async graph run): scrape on a separate thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
@@ -0,0 +1,219 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from typing import Annotated, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .config import get_config
+from .indicator_engine import SUPPORTED_INDICATORS, IndicatorEngine
+from .price_store import YFIN_CSV_TEMPLATE, PriceStore
+from .stockstats_utils import compute_indicator
+
+_CSV_PATTERN = re.compile(
+    "^" + re.escape(YFIN_CSV_TEMPLATE).replace(re.escape("{symbol}"), "(.+)") + "$"
+)
+
+
+def cube_dir_for(data_dir: Annotated[str, "root data directory"]) -> str:
+    return os.path.join(data_dir, "market_data", "indicator_cube")
+
+
+def _configured_engine() -> str:
+    return get_config().get("indicator_engine", "stockstats")
+
+
+def _source_stamp(path: str) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def build_indicator_cube(
+    data_dir: Annotated[str, "root data directory containing market_data/price_data"],
+    output_dir: Annotated[
+        Optional[str], "where to write the cube, defaults to market_data/indicator_cube"
+    ] = None,
+    tickers: Annotated[
+        Optional[Iterable[str]], "tickers to include, defaults to every YFin CSV found"
+    ] = None,
+    indicators: Annotated[
+        Iterable[str], "indicators to precompute"
+    ] = SUPPORTED_INDICATORS,
+    engine: Annotated[
+        Optional[str], "indicator engine, defaults to the configured indicator_engine"
+    ] = None,
+) -> str:
+    """
+    Precompute indicators for a ticker universe into a dense (ticker x date x indicator) float64 array.
+    Values are computed by the same engine and stored at the same precision as the computed path,
+    so reports read from the cube are identical to computed ones.
+    Returns:
+        str: the directory the cube was written to
+    """
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    output_dir = output_dir or cube_dir_for(data_dir)
+    indicators = list(indicators)
+    engine = engine or _configured_engine()
+
+    if tickers is None:
+        tickers = sorted(
+            match.group(1)
+            for match in map(_CSV_PATTERN.match, os.listdir(price_dir))
+            if match
+        )
+    tickers = list(tickers)
+    if not tickers:
+        raise ValueError(f"No YFin price data found in {price_dir}")
+
+    # the columnar copies are only needed for this build, keep them next to the cube
+    store = PriceStore(price_dir, store_dir=f"{output_dir}.price_store")
+    tables = {ticker: store.load(ticker) for ticker in tickers}
+    dates = np.unique(np.concatenate([np.asarray(t.dates) for t in tables.values()]))
+
+    tmp_dir = f"{output_dir}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(tmp_dir)
+    try:
+        cube = np.lib.format.open_memmap(
+            os.path.join(tmp_dir, "cube.npy"),
+            mode="w+",
+            dtype=np.float64,
+            shape=(len(tickers), len(dates), len(indicators)),
+        )
+        cube[:] = np.nan
+
+        for t, ticker in enumerate(tickers):
+            table = tables[ticker]
+            frame = table.to_frame()
+            native = IndicatorEngine(frame) if engine == "native" else None
+            # keep the first row of a date, like the computed lookups do
+            _, first = np.unique(np.asarray(table.dates), return_index=True)
+            rows = np.searchsorted(dates, np.asarray(table.dates)[first])
+            for i, indicator in enumerate(indicators):
+                if native is not None:
+                    values = native.get(indicator)
+                else:
+                    values = compute_indicator(frame.copy(), indicator, engine)
+                cube[t, rows, i] = np.asarray(values, dtype=np.float64)[first]
+        cube.flush()
+        del cube
+
+        np.save(os.path.join(tmp_dir, "dates.npy"), dates)
+        meta = {
+            "tickers": tickers,
+            "indicators": indicators,
+            "engine": engine,
+            "sources": {
+                ticker: _source_stamp(store.csv_path(ticker)) for ticker in tickers
+            },
+        }
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        shutil.rmtree(output_dir, ignore_errors=True)
+        os.rename(tmp_dir, output_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    finally:
+        shutil.rmtree(f"{output_dir}.price_store", ignore_errors=True)
+
+    return output_dir
+
+
+class IndicatorCube:
+    """Read-only, memory-mapped view of a cube written by build_indicator_cube."""
+
+    def __init__(self, cube_dir: str, price_dir: str):
+        self.cube_dir = cube_dir
+        self.price_dir = price_dir
+        with open(os.path.join(cube_dir, "meta.json"), "r") as f:
+            meta = json.load(f)
+
+        self.ticker_index = {ticker: i for i, ticker in enumerate(meta["tickers"])}
+        self.indicator_index = {name: i for i, name in enumerate(meta["indicators"])}
+        self.sources = meta["sources"]
+        # cubes written before the engine was recorded were computed natively
+        self.engine = meta.get("engine", "native")
+        self.dates = np.load(os.path.join(cube_dir, "dates.npy"), mmap_mode="r")
+        self.values = np.load(os.path.join(cube_dir, "cube.npy"), mmap_mode="r")
+
+    def has(self, symbol: str, indicator: str) -> bool:
+        """
+        Whether the cube holds an up to date series for this symbol and indicator, computed by
+        the configured indicator engine.
+        """
+        if symbol not in self.ticker_index or indicator not in self.indicator_index:
+            return False
+        if self.engine != _configured_engine():
+            return False
+        csv_path = os.path.join(self.price_dir, YFIN_CSV_TEMPLATE.format(symbol=symbol))
+        try:
+            return _source_stamp(csv_path) == self.sources[symbol]
+        except FileNotFoundError:
+            return False
+
+    def get_range(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicator: Annotated[str, "technical indicator"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    ) -> Dict[str, float]:
+        """yyyy-mm-dd date -> indicator value for the cube dates between start_date and end_date."""
+        lo = int(np.searchsorted(self.dates, start_date, side="left"))
+        hi = int(np.searchsorted(self.dates, end_date, side="right"))
+        column = self.values[
+            self.ticker_index[symbol], lo:hi, self.indicator_index[indicator]
+        ]
+        return dict(zip(self.dates[lo:hi].tolist(), np.array(column).tolist()))
+
+
+_cubes: Dict[str, tuple] = {}
+_cubes_lock = threading.Lock()
+
+
+def get_indicator_cube(data_dir: Annotated[str, "root data directory"]) -> Optional[IndicatorCube]:
+    """Return the indicator cube of a data directory, or None if none has been built."""
+    cube_dir = cube_dir_for(data_dir)
+    meta_path = os.path.join(cube_dir, "meta.json")
+    try:
+        stamp = os.stat(meta_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    key = os.path.abspath(cube_dir)
+    with _cubes_lock:
+        cached = _cubes.get(key)
+        if cached is None or cached[0] != stamp:
+            # (re)open the cube whenever it has been rebuilt
+            cached = (
+                stamp,
+                IndicatorCube(cube_dir, os.path.join(data_dir, "market_data", "price_data")),
+            )
+            _cubes[key] = cached
+        return cached[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precompute technical indicators for every ticker in the data directory."
+    )
+    parser.add_argument("--data-dir", required=True, help="root data directory")
+    parser.add_argument("--output-dir", default=None, help="cube output directory")
+    parser.add_argument("--tickers", nargs="*", default=None, help="tickers to include")
+    parser.add_argument(
+        "--engine",
+        choices=["stockstats", "native"],
+        default=None,
+        help="indicator engine, defaults to the configured indicator_engine",
+    )
+    args = parser.parse_args()
+
+    path = build_indicator_cube(
+        args.data_dir, args.output_dir, args.tickers, engine=args.engine
+    )
+    print(f"Indicator cube written to {path}")
@@ -0,0 +1,307 @@
+import re
+import warnings
+from typing import Annotated, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+# Indicators the market analyst can request, computed with the stockstats default windows
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+# Same defaults as stockstats
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+_MOVING_AVERAGE = re.compile(r"^(open|high|low|close|volume)_(\d+)_(sma|ema)$")
+_WINDOWED = re.compile(r"^(rsi|atr|vwma|mfi)(?:_(\d+))?$")
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` rows, averaging the available rows at the start (min_periods=1)."""
+    windows = _trailing_windows(values, window)
+    with np.errstate(invalid="ignore"):
+        return _nan_reduce(np.nanmean, windows)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample standard deviation (ddof=1) over `window` rows, min_periods=1."""
+    windows = _trailing_windows(values, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _nan_reduce(np.nanstd, windows, ddof=1)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum over `window` rows, summing the available rows at the start."""
+    cumsum = np.cumsum(values)
+    out = cumsum.copy()
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+def ewm_mean(
+    values: np.ndarray,
+    alpha: float,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """
+    Adjusted exponentially weighted mean, equivalent to pandas ewm(alpha=alpha, adjust=True).mean().
+
+    y_t = sum_i (1 - alpha)^i x_{t-i} / sum_i (1 - alpha)^i over the non-NaN x, evaluated
+    block by block with cumulative sums of rescaled weights so there is no per-row Python loop.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+
+    beta = 1.0 - alpha
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    counts = np.cumsum(valid)
+
+    if beta == 0.0:
+        num = filled
+        den = valid.astype(float)
+    else:
+        # keep beta**-block_size well inside the float range
+        block_size = max(1, min(n, int(250 / max(-np.log10(beta), 1e-12))))
+        num = np.empty(n)
+        den = np.empty(n)
+        prev_num = 0.0
+        prev_den = 0.0
+        for start in range(0, n, block_size):
+            stop = min(n, start + block_size)
+            steps = np.arange(stop - start)
+            decay = beta ** steps
+            growth = beta ** -steps
+            num[start:stop] = decay * (
+                beta * prev_num + np.cumsum(filled[start:stop] * growth)
+            )
+            den[start:stop] = decay * (
+                beta * prev_den + np.cumsum(valid[start:stop] * growth)
+            )
+            prev_num = num[stop - 1]
+            prev_den = den[stop - 1]
+
+    ready = (counts >= max(min_periods, 1)) & (den > 0)
+    out[ready] = num[ready] / den[ready]
+    return out
+
+
+def ema(values: np.ndarray, window: int) -> np.ndarray:
+    """Exponential moving average with span `window`, like stockstats' `close_N_ema`."""
+    return ewm_mean(values, 2.0 / (window + 1), min_periods=1)
+
+
+def smma(values: np.ndarray, window: int) -> np.ndarray:
+    """Smoothed (Wilder) moving average, ewm with alpha = 1 / window."""
+    return ewm_mean(values, 1.0 / window, min_periods=0)
+
+
+def _trailing_windows(values: np.ndarray, window: int) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    padded = np.concatenate([np.full(window - 1, np.nan), values])
+    return np.lib.stride_tricks.sliding_window_view(padded, window)
+
+
+def _nan_reduce(func, windows: np.ndarray, **kwargs) -> np.ndarray:
+    with warnings.catch_warnings():
+        # all-NaN or single-value windows yield NaN, exactly like pandas
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return func(windows, axis=1, **kwargs)
+
+
+def _column(prices: Mapping, name: str) -> np.ndarray:
+    for key in (name, name.capitalize(), name.upper()):
+        if key in prices:
+            return np.asarray(prices[key], dtype=float)
+    raise KeyError(f"Price data has no '{name}' column")
+
+
+class IndicatorEngine:
+    """
+    Vectorized indicator computation over one price history.
+
+    Intermediate series (EMAs, true range, typical price, ...) are computed once and shared,
+    so requesting several indicators costs a single pass over the price arrays.
+    """
+
+    def __init__(
+        self,
+        prices: Annotated[
+            Mapping, "DataFrame or dict with open/high/low/close/volume columns"
+        ],
+    ):
+        self.prices = prices
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def _memo(self, key, func):
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
+    def column(self, name: str) -> np.ndarray:
+        return self._memo(f"col:{name}", lambda: _column(self.prices, name))
+
+    def typical_price(self) -> np.ndarray:
+        return self._memo(
+            "tp",
+            lambda: np.nan_to_num(
+                (self.column("close") + self.column("high") + self.column("low")) / 3.0
+            ),
+        )
+
+    def true_range(self) -> np.ndarray:
+        def compute():
+            close = self.column("close")
+            high = self.column("high")
+            low = self.column("low")
+            prev_close = np.empty_like(close)
+            if len(close):
+                prev_close[0] = close[0]
+                prev_close[1:] = close[:-1]
+            tr = np.maximum(
+                high - low,
+                np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+            )
+            return np.nan_to_num(tr)
+
+        return self._memo("tr", compute)
+
+    def sma(self, column: str, window: int) -> np.ndarray:
+        return self._memo(
+            f"{column}_{window}_sma", lambda: rolling_mean(self.column(column), window)
+        )
+
+    def ema(self, column: str, window: int) -> np.ndarray:
+        return self._memo(
+            f"{column}_{window}_ema", lambda: ema(self.column(column), window)
+        )
+
+    def macd(self):
+        short_w, long_w, signal_w = MACD_WINDOWS
+
+        def compute():
+            macd = self.ema("close", short_w) - self.ema("close", long_w)
+            macds = ema(macd, signal_w)
+            return macd, macds, macd - macds
+
+        return self._memo("macd_family", compute)
+
+    def rsi(self, window: int = RSI_WINDOW) -> np.ndarray:
+        def compute():
+            close = self.column("close")
+            diff = np.zeros_like(close)
+            diff[1:] = np.diff(close)
+            up = smma(np.where(diff > 0, diff, 0.0), window)
+            down = smma(np.where(diff < 0, -diff, 0.0), window)
+            total = up + down
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = np.where(total != 0, 100 * (up / total), 50.0)
+            if len(rsi):
+                rsi[0] = 50.0
+            return np.nan_to_num(rsi)
+
+        return self._memo(f"rsi_{window}", compute)
+
+    def boll(self, window: int = BOLL_WINDOW):
+        def compute():
+            close = self.column("close")
+            middle = rolling_mean(close, window)
+            width = BOLL_STD_TIMES * rolling_std(close, window)
+            return middle, middle + width, middle - width
+
+        return self._memo(f"boll_{window}", compute)
+
+    def atr(self, window: int = ATR_WINDOW) -> np.ndarray:
+        return self._memo(f"atr_{window}", lambda: smma(self.true_range(), window))
+
+    def vwma(self, window: int = VWMA_WINDOW) -> np.ndarray:
+        def compute():
+            volume = self.column("volume")
+            rolling_tpv = rolling_sum(volume * self.typical_price(), window)
+            rolling_vol = rolling_sum(volume, window)
+            return np.divide(
+                rolling_tpv,
+                rolling_vol,
+                out=np.zeros_like(rolling_tpv),
+                where=rolling_vol != 0,
+            )
+
+        return self._memo(f"vwma_{window}", compute)
+
+    def mfi(self, window: int = MFI_WINDOW) -> np.ndarray:
+        def compute():
+            tp = self.typical_price()
+            raw_money_flow = tp * self.column("volume")
+            tp_diff = np.zeros_like(tp)
+            tp_diff[1:] = np.diff(tp)
+            pos_sum = rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+            neg_sum = rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+            total_flow = pos_sum + neg_sum
+            mfi = np.divide(
+                pos_sum,
+                total_flow,
+                out=np.full_like(pos_sum, 0.5),
+                where=total_flow > 0,
+            )
+            mfi[:window] = 0.5
+            return np.nan_to_num(mfi)
+
+        return self._memo(f"mfi_{window}", compute)
+
+    def get(self, indicator: Annotated[str, "stockstats-style indicator name"]) -> np.ndarray:
+        """Return the series of a single indicator, e.g. 'close_50_sma', 'macdh' or 'rsi'."""
+        match = _MOVING_AVERAGE.match(indicator)
+        if match:
+            column, window, kind = match.groups()
+            if kind == "sma":
+                return self.sma(column, int(window))
+            return self.ema(column, int(window))
+
+        if indicator in ("macd", "macds", "macdh"):
+            return self.macd()[("macd", "macds", "macdh").index(indicator)]
+
+        if indicator in ("boll", "boll_ub", "boll_lb"):
+            return self.boll()[("boll", "boll_ub", "boll_lb").index(indicator)]
+
+        match = _WINDOWED.match(indicator)
+        if match:
+            name, window = match.groups()
+            return getattr(self, name)(int(window)) if window else getattr(self, name)()
+
+        raise ValueError(
+            f"Indicator {indicator} is not supported by the native engine. Please choose from: {list(SUPPORTED_INDICATORS)}"
+        )
+
+
+def compute_indicators(
+    prices: Annotated[Mapping, "DataFrame or dict with open/high/low/close/volume columns"],
+    indicators: Annotated[
+        Optional[Iterable[str]], "indicators to compute, defaults to all supported ones"
+    ] = None,
+) -> Dict[str, np.ndarray]:
+    """Compute a set of indicators over one price history in a single pass."""
+    engine = IndicatorEngine(prices)
+    if indicators is None:
+        indicators = SUPPORTED_INDICATORS
+    return {indicator: engine.get(indicator) for indicator in indicators}
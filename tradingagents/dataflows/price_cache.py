@@ -0,0 +1,117 @@
+import json
+import os
+import uuid
+from typing import Annotated, Callable, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from . import singleflight
+
+# How much history the first download of a symbol covers
+HISTORY_YEARS = 15
+
+
+def _history_path(cache_dir: str, symbol: str) -> str:
+    return os.path.join(cache_dir, f"{symbol}-YFin-history.csv")
+
+
+def _state_path(cache_dir: str, symbol: str) -> str:
+    return os.path.join(cache_dir, f"{symbol}-YFin-history.json")
+
+
+def _atomic_write(path: str, write: Callable[[str], None]):
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _download(downloader, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    data = downloader(
+        symbol,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    data = data.reset_index()
+    if len(data) and "Date" in data.columns:
+        data["Date"] = pd.to_datetime(data["Date"])
+    return data
+
+
+def load_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    cache_dir: Annotated[str, "directory holding the per-symbol history files"],
+    downloader: Annotated[
+        Optional[Callable], "function with the yf.download signature, defaults to yf.download"
+    ] = None,
+    today: Annotated[Optional[pd.Timestamp], "override of the current date, for tests"] = None,
+) -> pd.DataFrame:
+    """
+    Return the daily price history of a symbol from an incrementally updated on-disk cache.
+
+    The first call downloads HISTORY_YEARS of bars. Later calls only download the bars after the
+    last cached one (at most once per day), merge them into the history and atomically replace
+    the cache file, so each new day costs a small tail fetch instead of a full redownload.
+    Concurrent calls for the same symbol share one update; each caller gets its own copy.
+    """
+    history = singleflight.do(
+        ("price_history", os.path.abspath(cache_dir), symbol),
+        lambda: _update_price_history(symbol, cache_dir, downloader, today),
+    )
+    return history.copy()
+
+
+def _update_price_history(symbol, cache_dir, downloader, today) -> pd.DataFrame:
+    downloader = downloader or yf.download
+    today = (today or pd.Timestamp.today()).normalize()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    history_path = _history_path(cache_dir, symbol)
+    state_path = _state_path(cache_dir, symbol)
+
+    checked_on = None
+    if os.path.exists(state_path):
+        with open(state_path, "r") as f:
+            checked_on = json.load(f).get("checked_on")
+
+    if os.path.exists(history_path):
+        history = pd.read_csv(history_path)
+        history["Date"] = pd.to_datetime(history["Date"])
+    else:
+        history = None
+
+    if history is not None and checked_on == today.strftime("%Y-%m-%d"):
+        return history
+
+    if history is None or history.empty:
+        start = today - pd.DateOffset(years=HISTORY_YEARS)
+        merged = _download(downloader, symbol, start, today)
+    else:
+        merged = history
+        start = history["Date"].max().normalize() + pd.DateOffset(days=1)
+        if start < today:
+            tail = _download(downloader, symbol, start, today)
+            if not tail.empty:
+                merged = (
+                    pd.concat([history, tail], ignore_index=True)
+                    .drop_duplicates(subset="Date", keep="last")
+                    .sort_values("Date")
+                    .reset_index(drop=True)
+                )
+
+    if merged is not history and not merged.empty:
+        _atomic_write(history_path, lambda path: merged.to_csv(path, index=False))
+
+    def write_state(path):
+        with open(path, "w") as f:
+            json.dump({"checked_on": today.strftime("%Y-%m-%d")}, f)
+
+    _atomic_write(state_path, write_state)
+    return merged
@@ -0,0 +1,198 @@
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+YFIN_CSV_TEMPLATE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+# Name of the sorted date key column, stored next to the data columns
+_DATE_KEY = "__date_key__"
+
+
+class PriceTable:
+    """Memory-mapped columns of a single symbol's price history."""
+
+    def __init__(self, table_dir: str):
+        self.table_dir = table_dir
+        with open(os.path.join(table_dir, "meta.json"), "r") as f:
+            self.meta = json.load(f)
+
+        self.columns = self.meta["columns"]
+        self.arrays = {
+            name: np.load(os.path.join(table_dir, f"{i}.npy"), mmap_mode="r")
+            for i, name in enumerate(self.columns)
+        }
+        # sorted "YYYY-MM-DD" strings, searched with the same ordering as a plain string compare
+        self.dates = np.load(os.path.join(table_dir, f"{_DATE_KEY}.npy"), mmap_mode="r")
+
+    def __len__(self):
+        return len(self.dates)
+
+    def bounds(self, start_date: str, end_date: str):
+        """Return the [lo, hi) row bounds of the dates within start_date and end_date (inclusive)."""
+        lo = int(np.searchsorted(self.dates, start_date, side="left"))
+        hi = int(np.searchsorted(self.dates, end_date, side="right"))
+        return lo, max(lo, hi)
+
+    def to_frame(self, lo: int = 0, hi: Optional[int] = None) -> pd.DataFrame:
+        """Materialize rows [lo, hi) as a DataFrame indexed by row position, like the original CSV."""
+        if hi is None:
+            hi = len(self)
+        data = {name: np.array(self.arrays[name][lo:hi]) for name in self.columns}
+        return pd.DataFrame(data, index=pd.RangeIndex(lo, hi))
+
+    def contains(self, date: str) -> bool:
+        pos = int(np.searchsorted(self.dates, date, side="left"))
+        return pos < len(self.dates) and self.dates[pos] == date
+
+
+class PriceStore:
+    """Ingests the YFin CSVs once into per-column .npy files and serves date slices from them.
+
+    Each CSV is converted the first time it is requested (or whenever the CSV changes on disk)
+    and afterwards only the memory-mapped columns are touched, so a date range lookup is two
+    binary searches on the sorted date array instead of a full CSV parse.
+    """
+
+    def __init__(
+        self,
+        price_dir: Annotated[str, "directory holding the {symbol}-YFin-data-*.csv files"],
+        store_dir: Annotated[
+            Optional[str], "directory for the columnar copies, defaults to the data cache"
+        ] = None,
+    ):
+        self.price_dir = price_dir
+        if store_dir is None:
+            store_dir = os.path.join(get_config()["data_cache_dir"], "price_store")
+        self.store_dir = store_dir
+        self._tables: Dict[str, PriceTable] = {}
+        self._lock = threading.Lock()
+
+    def csv_path(self, symbol: str) -> str:
+        return os.path.join(self.price_dir, YFIN_CSV_TEMPLATE.format(symbol=symbol))
+
+    def _table_dir(self, symbol: str, stat: os.stat_result) -> str:
+        # the source size and mtime are part of the directory name, so a table is immutable once written
+        return os.path.join(
+            self.store_dir, f"{symbol}-{stat.st_size}-{stat.st_mtime_ns}"
+        )
+
+    def ingest(self, symbol: str) -> str:
+        """Convert the symbol's CSV into columnar form and return the table directory."""
+        csv_path = self.csv_path(symbol)
+        stat = os.stat(csv_path)
+        table_dir = self._table_dir(symbol, stat)
+        if os.path.exists(os.path.join(table_dir, "meta.json")):
+            return table_dir
+
+        data = pd.read_csv(csv_path)
+        date_key = data["Date"].astype(str).str[:10].to_numpy(dtype="U10")
+
+        order = np.argsort(date_key, kind="stable")
+        is_sorted = bool(np.all(order == np.arange(len(order))))
+        if not is_sorted:
+            data = data.iloc[order].reset_index(drop=True)
+            date_key = date_key[order]
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_dir = f"{table_dir}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(tmp_dir)
+        try:
+            columns = list(data.columns)
+            for i, name in enumerate(columns):
+                values = data[name].to_numpy()
+                if values.dtype == object:
+                    values = values.astype(str)
+                np.save(os.path.join(tmp_dir, f"{i}.npy"), values)
+            np.save(os.path.join(tmp_dir, f"{_DATE_KEY}.npy"), date_key)
+
+            meta = {
+                "symbol": symbol,
+                "columns": columns,
+                "rows": len(data),
+                "sorted_on_ingest": not is_sorted,
+                "source": os.path.basename(csv_path),
+            }
+            with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+                json.dump(meta, f)
+
+            try:
+                os.rename(tmp_dir, table_dir)
+            except OSError:
+                # another worker finished the same ingest first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self._remove_stale_tables(symbol, keep=table_dir)
+        return table_dir
+
+    def _remove_stale_tables(self, symbol: str, keep: str):
+        prefix = f"{symbol}-"
+        for name in os.listdir(self.store_dir):
+            path = os.path.join(self.store_dir, name)
+            if path == keep or not name.startswith(prefix) or ".tmp-" in name:
+                continue
+            # only drop versions of this exact symbol (e.g. not "BRK-B" when cleaning "BRK")
+            if not re.fullmatch(r"\d+-\d+", name[len(prefix):]):
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+
+    def load(self, symbol: str) -> PriceTable:
+        """Return the memory-mapped table for a symbol, ingesting or refreshing it when needed."""
+        stat = os.stat(self.csv_path(symbol))
+        table_dir = self._table_dir(symbol, stat)
+
+        table = self._tables.get(symbol)
+        if table is not None and table.table_dir == table_dir:
+            return table
+
+        with self._lock:
+            table = self._tables.get(symbol)
+            if table is None or table.table_dir != table_dir:
+                table = PriceTable(self.ingest(symbol))
+                self._tables[symbol] = table
+        return table
+
+    def get_range(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    ) -> pd.DataFrame:
+        """Rows with start_date <= Date <= end_date, indexed by their original CSV row number."""
+        table = self.load(symbol)
+        lo, hi = table.bounds(start_date, end_date)
+        return table.to_frame(lo, hi)
+
+    def get_frame(self, symbol: Annotated[str, "ticker symbol of the company"]) -> pd.DataFrame:
+        """The full price history of a symbol, equivalent to reading its CSV."""
+        return self.load(symbol).to_frame()
+
+    def get_dates(self, symbol: Annotated[str, "ticker symbol of the company"]) -> np.ndarray:
+        """Sorted trading dates (yyyy-mm-dd) available for a symbol."""
+        return self.load(symbol).dates
+
+
+_stores: Dict[str, PriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(price_dir: Annotated[str, "directory holding the YFin CSVs"]) -> PriceStore:
+    """Return the shared PriceStore for a price data directory."""
+    key = os.path.abspath(price_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = PriceStore(price_dir)
+            _stores[key] = store
+    return store
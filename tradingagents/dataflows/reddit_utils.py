@@ -1,11 +1,16 @@
 import requests
 import time
 import json
+import hashlib
+import threading
+import uuid
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Callable, Dict, Iterable, List, Optional
 import os
 import re
+from .config import get_config
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,74 +54,159 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
-    category: Annotated[
-        str, "Category to fetch top post from. Collection of subreddits."
-    ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
-    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
-    data_path: Annotated[
-        str,
-        "Path to the data folder. Default is 'reddit_data'.",
-    ] = "reddit_data",
-):
-    base_path = data_path
+def _post_date(parsed_line) -> str:
+    return datetime.utcfromtimestamp(parsed_line["created_utc"]).strftime("%Y-%m-%d")
+
+
+def _index_path(index_dir: str, file_path: str) -> str:
+    key = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+    return os.path.join(index_dir, f"{key}.json")
+
+
+def build_reddit_index(
+    file_path: Annotated[str, "Path to a subreddit .jsonl file."],
+) -> Dict[str, List[List[int]]]:
+    """
+    Scan a subreddit file once and record, for every UTC date, the [start, end) byte spans of
+    the lines posted on that date. Consecutive lines of the same date share a single span.
+    """
+    days: Dict[str, List[List[int]]] = {}
+    with open(file_path, "rb") as f:
+        offset = 0
+        for line in f:
+            end = offset + len(line)
+            # skip empty lines
+            if line.strip():
+                spans = days.setdefault(_post_date(json.loads(line)), [])
+                if spans and spans[-1][1] == offset:
+                    spans[-1][1] = end
+                else:
+                    spans.append([offset, end])
+            offset = end
+    return days
+
+
+_indexes: Dict[str, tuple] = {}
+_indexes_lock = threading.Lock()
+
+
+def load_reddit_index(
+    file_path: Annotated[str, "Path to a subreddit .jsonl file."],
+    index_dir: Annotated[
+        Optional[str], "Where indexes are kept. Default is the data cache directory."
+    ] = None,
+) -> Dict[str, List[List[int]]]:
+    """Return the per-day byte spans of a subreddit file, (re)building the index when the file changed."""
+    if index_dir is None:
+        index_dir = os.path.join(get_config()["data_cache_dir"], "reddit_index")
+    stat = os.stat(file_path)
+    stamp = [stat.st_size, stat.st_mtime_ns]
+    path = _index_path(index_dir, file_path)
 
-    all_content = []
+    with _indexes_lock:
+        cached = _indexes.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+        days = None
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                stored = json.load(f)
+            if stored["stamp"] == stamp:
+                days = stored["days"]
+
+        if days is None:
+            days = build_reddit_index(file_path)
+            # indexes live outside the category folders, whose file count sets the per-subreddit limit
+            os.makedirs(index_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+            with open(tmp_path, "w") as f:
+                json.dump({"source": os.path.abspath(file_path), "stamp": stamp, "days": days}, f)
+            os.replace(tmp_path, path)
+
+        _indexes[path] = (stamp, days)
+        return days
+
+
+def _read_lines(f, spans: List[List[int]]):
+    for start, end in spans:
+        f.seek(start)
+        for line in f.read(end - start).split(b"\n"):
+            # skip empty lines
+            if line.strip():
+                yield json.loads(line)
+
+
+@lru_cache(maxsize=None)
+def company_matcher(ticker: Annotated[str, "ticker symbol of the company"]) -> re.Pattern:
+    """
+    One compiled, case-insensitive alternation of the company's names and its ticker, built once
+    per ticker. Terms are used as regular expressions, exactly like the per-term searches were.
+    """
+    search_terms = ticker_to_company[ticker].split(" OR ") + [ticker]
+    return re.compile("|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE)
+
+
+def _mentions(matcher: re.Pattern, parsed_line) -> bool:
+    return bool(
+        matcher.search(parsed_line["title"]) or matcher.search(parsed_line["selftext"])
+    )
+
+
+def _limit_per_subreddit(base_path: str, category: str, max_limit: int) -> int:
+    num_files = len(os.listdir(os.path.join(base_path, category)))
+    if max_limit < num_files:
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
+    return max_limit // num_files
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    dates = []
+    curr_date = datetime.strptime(start_date, "%Y-%m-%d")
+    while curr_date <= datetime.strptime(end_date, "%Y-%m-%d"):
+        dates.append(curr_date.strftime("%Y-%m-%d"))
+        curr_date += timedelta(days=1)
+    return dates
+
+
+def _scan_category(
+    category: str,
+    dates: List[str],
+    max_limit: int,
+    keys: List,
+    tag: Callable[[dict], Iterable],
+    data_path: str,
+) -> Dict[object, Dict[str, List[dict]]]:
+    """
+    Read the posts of the given dates from every subreddit file of a category once, file the
+    posts under each key returned by tag(post) and keep the top posts per key, date and file.
+    """
+    base_path = data_path
+    limit_per_subreddit = _limit_per_subreddit(base_path, category, max_limit)
+
+    all_content = {key: {date: [] for date in dates} for key in keys}
 
     for data_file in os.listdir(os.path.join(base_path, category)):
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
+        file_path = os.path.join(base_path, category, data_file)
+        index = load_reddit_index(file_path)
+        spans = sorted(span for date in dates for span in index.get(date, []))
+        if not spans:
+            continue
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
+        content_curr_subreddit = {key: {date: [] for date in dates} for key in keys}
+        with open(file_path, "rb") as f:
+            for parsed_line in _read_lines(f, spans):
+                matched_keys = tag(parsed_line)
+                if not matched_keys:
                     continue
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
+                post_date = _post_date(parsed_line)
                 post = {
                     "title": parsed_line["title"],
                     "content": parsed_line["selftext"],
@@ -124,12 +214,90 @@ def fetch_top_from_category(
                     "upvotes": parsed_line["ups"],
                     "posted_date": post_date,
                 }
+                for key in matched_keys:
+                    content_curr_subreddit[key][post_date].append(dict(post))
 
-                all_content_curr_subreddit.append(post)
+        for key, days in content_curr_subreddit.items():
+            for date, posts in days.items():
+                # sort posts by upvotes in descending order
+                posts.sort(key=lambda x: x["upvotes"], reverse=True)
+                all_content[key][date].extend(posts[:limit_per_subreddit])
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> Dict[str, List[dict]]:
+    """
+    Top posts of every day between start_date and end_date (inclusive), read in one pass per
+    subreddit file. Each day holds exactly what fetch_top_from_category returns for that day.
+    """
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    if "company" in category and query:
+        matcher = company_matcher(query)
+        tag = lambda parsed_line: (None,) if _mentions(matcher, parsed_line) else ()
+    else:
+        tag = lambda parsed_line: (None,)
+
+    return _scan_category(
+        category, _date_range(start_date, end_date), max_limit, [None], tag, data_path
+    )[None]
+
+
+def fetch_top_for_tickers(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    tickers: Annotated[List[str], "Tickers to tag the posts with."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> Dict[str, Dict[str, List[dict]]]:
+    """
+    Tag every post of the date range with all the tickers it mentions in a single pass over the
+    category. Returns ticker -> date -> posts, the same as fetch_top_from_category_range per ticker.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if "company" in category:
+        matchers = [(ticker, company_matcher(ticker)) for ticker in tickers]
+        tag = lambda parsed_line: [
+            ticker for ticker, matcher in matchers if _mentions(matcher, parsed_line)
+        ]
+    else:
+        tag = lambda parsed_line: tickers
+
+    return _scan_category(
+        category, _date_range(start_date, end_date), max_limit, tickers, tag, data_path
+    )
+
+
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path=data_path
+    )[date]
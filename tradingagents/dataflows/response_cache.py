@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Annotated, Dict, Iterator, Optional
+
+import tradingagents.default_config as default_config
+
+from .config import get_config
+
+
+class ResponseCache:
+    """
+    Persistent cache of tool responses in a SQLite file, keyed by tool, ticker, date and model.
+
+    Entries expire after ttl_seconds, and once the cache holds more than max_entries the least
+    recently used ones are evicted; both default to the values in the default config. Every
+    call opens (and closes) its own connection, so the cache can be shared by threads and by
+    separate processes working on the same file.
+    """
+
+    def __init__(
+        self,
+        path: Annotated[str, "SQLite file holding the cache"],
+        ttl_seconds: Annotated[Optional[float], "how long an entry stays valid"] = None,
+        max_entries: Annotated[
+            Optional[int], "entries kept before the least recently used are evicted"
+        ] = None,
+    ):
+        self.path = path
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else default_config.DEFAULT_CONFIG["response_cache_ttl_seconds"]
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else default_config.DEFAULT_CONFIG["response_cache_max_entries"]
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    tool TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (tool, ticker, date, model)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection whose transaction commits (or rolls back) with the block, then closes."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, tool: str, ticker: str, date: str, model: str) -> Optional[str]:
+        """Return the cached response, or None when it is missing or has expired."""
+        now = time.time()
+        key = (tool, ticker, date, model)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE tool=? AND ticker=? AND date=? AND model=?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                conn.execute(
+                    "DELETE FROM responses WHERE tool=? AND ticker=? AND date=? AND model=?",
+                    key,
+                )
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed_at=? WHERE tool=? AND ticker=? AND date=? AND model=?",
+                (now, *key),
+            )
+            return row[0]
+
+    def set(self, tool: str, ticker: str, date: str, model: str, value: str):
+        """Store a response and evict expired and least recently used entries."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (tool, ticker, date, model, value, now, now),
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            conn.execute(
+                """
+                DELETE FROM responses WHERE rowid IN (
+                    SELECT rowid FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+_caches: Dict[tuple, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared response cache configured in the current config, or None if disabled."""
+    config = get_config()
+    ttl_seconds = config["response_cache_ttl_seconds"]
+    if not ttl_seconds:
+        return None
+
+    path = os.path.join(config["data_cache_dir"], "responses.sqlite")
+    key = (os.path.abspath(path), ttl_seconds, config["response_cache_max_entries"])
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResponseCache(path, ttl_seconds, config["response_cache_max_entries"])
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,85 @@
+import contextvars
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .singleflight import SingleFlight
+
+_current: contextvars.ContextVar[Optional["RunCache"]] = contextvars.ContextVar(
+    "tradingagents_run_cache", default=None
+)
+
+
+class RunCache:
+    """
+    Results of dataflow calls made during one graph run.
+
+    The cache is activated for the duration of a run and is visible to every node and tool
+    executed in that run's context, so data prefetched at the start of the graph is served
+    from memory when an analyst's tool asks for it later. Concurrent requests for the same
+    key are coalesced.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+
+        def compute():
+            result = fn()
+            with self._lock:
+                self._results[key] = result
+                self.misses += 1
+            return result
+
+        return self._flight.do(key, compute)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def __len__(self):
+        with self._lock:
+            return len(self._results)
+
+
+def current_run_cache() -> Optional[RunCache]:
+    """The run cache active in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def run_cache(cache: Optional[RunCache] = None):
+    """Activate a run cache (a new one by default) for the code executed inside the block."""
+    cache = cache if cache is not None else RunCache()
+    token = _current.set(cache)
+    try:
+        yield cache
+    finally:
+        _current.reset(token)
+
+
+def run_cached(func):
+    """
+    Memoize a dataflow function in the active run cache, keyed by its name and arguments.
+    Outside of a run (no active cache) the function is called as usual.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _current.get()
+        if cache is None:
+            return func(*args, **kwargs)
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
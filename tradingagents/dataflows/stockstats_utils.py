@@ -1,12 +1,100 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from stockstats import wrap
-from typing import Annotated
-import os
+from functools import lru_cache
+from typing import Annotated, Dict, Optional, Tuple
 from .config import get_config
+from .indicator_engine import IndicatorEngine
+from .price_cache import load_price_history
+from .price_store import PriceTable, get_price_store
+
+# Indicator series kept in memory, so runs over adjacent days do not recompute them
+INDICATOR_SERIES_CACHE_SIZE = 256
+
+
+def compute_indicator(df: pd.DataFrame, indicator: str, engine: Optional[str] = None):
+    """Compute an indicator series over a price frame with the given (default: configured) engine."""
+    if engine is None:
+        engine = get_config().get("indicator_engine", "stockstats")
+    if engine == "native":
+        return IndicatorEngine(df).get(indicator)
+
+    # stockstats is only imported when it is actually used
+    from stockstats import wrap
+
+    return wrap(df)[indicator].values
+
+
+@lru_cache(maxsize=INDICATOR_SERIES_CACHE_SIZE)
+def _table_indicator_series(table_dir: str, indicator: str, engine: str):
+    # a table directory is immutable (it is named after the source CSV's size and mtime),
+    # and the engine is part of the key, so a cached series never goes stale
+    df = PriceTable(table_dir).to_frame()
+    dates = df["Date"].astype(str).to_numpy()
+    values = np.asarray(compute_indicator(df, indicator, engine))
+    dates.setflags(write=False)
+    values.setflags(write=False)
+    return dates, values
 
 
 class StockstatsUtils:
+    @staticmethod
+    def load_stock_frame(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        """Load the price history of a symbol as a frame with yyyy-mm-dd Date strings."""
+        if not online:
+            try:
+                df = get_price_store(data_dir).get_frame(symbol)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        else:
+            # Get config and read the incrementally updated price history
+            config = get_config()
+            data = load_price_history(symbol, config["data_cache_dir"])
+
+            data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")
+            df = data
+
+        return df
+
+    @staticmethod
+    def get_indicator_series(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the Date strings and the indicator values of a symbol's full price history.
+        Offline series are memoized per price table and indicator engine.
+        """
+        if not online:
+            try:
+                table = get_price_store(data_dir).load(symbol)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            engine = get_config().get("indicator_engine", "stockstats")
+            return _table_indicator_series(table.table_dir, indicator, engine)
+
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
+        return df["Date"].astype(str).to_numpy(), np.asarray(compute_indicator(df, indicator))
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -25,63 +113,50 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
-
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
+        dates, values = StockstatsUtils.get_indicator_series(
+            symbol, indicator, data_dir, online
+        )
+        if online:
+            curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
+        matching_rows = np.char.startswith(dates.astype(str), curr_date)
 
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
-
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if matching_rows.any():
+            indicator_value = values[matching_rows][0]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_range(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the range, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the range, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Dict[str, object]:
+        """
+        Compute the indicator series once and return its values for every trading day in the range.
+        Returns:
+            dict: yyyy-mm-dd date -> indicator value, for the trading days between start_date and end_date (inclusive)
+        """
+        dates, values = StockstatsUtils.get_indicator_series(
+            symbol, indicator, data_dir, online
+        )
+        dates = dates.astype("U10")
+        in_range = (dates >= start_date) & (dates <= end_date)
+
+        indicator_values = {}
+        for date, value in zip(dates[in_range], values[in_range]):
+            # keep the first row of a date, like the single-day lookup does
+            indicator_values.setdefault(date, value)
+        return indicator_values
@@ -12,6 +12,19 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # Persistent store of the agents' reflection memories
+    "memory_dir": os.getenv(
+        "MEMORY_DIR",
+        os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/memory",
+        ),
+    ),
+    # "numpy" for the matrix index in agents/utils/vector_index.py, safe to share between
+    # worker processes, or "chroma", whose persistent client is only safe in one process
+    "memory_backend": os.getenv("MEMORY_BACKEND", "numpy"),
+    # Storage of the numpy index: "float32", or "int8" for a quarter of the size
+    "memory_index_dtype": os.getenv("MEMORY_INDEX_DTYPE", "float32"),
     # LLM settings
     "llm_provider": os.getenv("LLM_PROVIDER", "openai"),
     "deep_think_llm": os.getenv("DEEP_THINK_LLM", "gpt-4o"),
@@ -25,4 +38,23 @@ DEFAULT_CONFIG = {
     "selected_analysts": ["market"],
     # Tool settings
     "online_tools": os.getenv("ONLINE_TOOLS", "true").lower() == "true",
+    # "stockstats" or "native" (vectorized NumPy engine in dataflows/indicator_engine.py)
+    "indicator_engine": os.getenv("INDICATOR_ENGINE", "stockstats"),
+    # Google News scraping: result pages fetched at once and politeness limit on request starts
+    "google_news_max_concurrency": int(os.getenv("GOOGLE_NEWS_MAX_CONCURRENCY", "3")),
+    "google_news_requests_per_second": float(os.getenv("GOOGLE_NEWS_REQUESTS_PER_SECOND", "1.0")),
+    # Run the selected analysts concurrently instead of one after another
+    "parallel_analysts": os.getenv("PARALLEL_ANALYSTS", "false").lower() == "true",
+    # Fetch the analysts' data concurrently in a node before the first analyst runs
+    "prefetch_data": os.getenv("PREFETCH_DATA", "false").lower() == "true",
+    # Number of tickers analysed at once by TradingAgentsGraph.propagate_batch
+    "batch_max_concurrency": int(os.getenv("BATCH_MAX_CONCURRENCY", "4")),
+    # Checkpoints of graph runs, so an interrupted run resumes: "sqlite", "memory" or "none"
+    "checkpointer": os.getenv("CHECKPOINTER", "sqlite"),
+    # Persistent cache of LLM responses keyed by model, parameters and messages (opt-in)
+    "llm_cache": os.getenv("LLM_CACHE", "false").lower() == "true",
+    "llm_cache_max_mb": float(os.getenv("LLM_CACHE_MAX_MB", "512")),
+    # Persistent cache of the OpenAI web-search tools (0 TTL disables it)
+    "response_cache_ttl_seconds": int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", str(6 * 3600))),
+    "response_cache_max_entries": int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000")),
 }
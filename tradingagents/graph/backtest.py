@@ -0,0 +1,170 @@
+# TradingAgents/graph/backtest.py
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tradingagents.dataflows.price_store import get_price_store
+
+
+class Backtester:
+    """Walks one ticker over a date range, running the graph and reflecting on every day.
+
+    Days are run one after another in the same process, so the price tables, indicator
+    series, fundamentals and news indexes loaded for one day are reused by the next.
+    Progress is checkpointed to a JSON file after every day and a rerun resumes after
+    the last completed day.
+    """
+
+    def __init__(
+        self,
+        graph,
+        checkpoint_path: Optional[str] = None,
+        holding_days: int = 1,
+        reflect: bool = True,
+        price_store=None,
+    ):
+        """Initialize the backtester.
+
+        Args:
+            graph: A TradingAgentsGraph (anything with propagate, reflect_and_remember and config)
+            checkpoint_path: JSON file recording completed days, None disables checkpointing
+            holding_days: Trading days between the decision and the close the return is measured at
+            reflect: Whether to call reflect_and_remember with the realized return
+            price_store: PriceStore serving the ticker's prices, defaults to the shared store of
+                the graph's data directory
+        """
+        self.graph = graph
+        self.checkpoint_path = checkpoint_path
+        self.holding_days = holding_days
+        self.reflect = reflect
+        self.price_store = price_store or get_price_store(
+            os.path.join(graph.config["data_dir"], "market_data", "price_data")
+        )
+
+    def trading_days(self, ticker: str, start_date: str, end_date: str) -> List[str]:
+        """Trading days of the ticker between start_date and end_date (inclusive)."""
+        table = self.price_store.load(ticker)
+        lo, hi = table.bounds(start_date, end_date)
+        return [str(date) for date in table.dates[lo:hi]]
+
+    def realized_return(self, ticker: str, trade_date: str) -> Optional[float]:
+        """Close-to-close return from trade_date to holding_days trading days later, in percent."""
+        table = self.price_store.load(ticker)
+        pos = int(np.searchsorted(table.dates, trade_date))
+        if not table.contains(trade_date) or pos + self.holding_days >= len(table):
+            return None
+
+        close = table.arrays["Close"]
+        return (float(close[pos + self.holding_days]) / float(close[pos]) - 1.0) * 100.0
+
+    def _load_checkpoint(self, ticker: str) -> Dict[str, Any]:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("ticker") == ticker:
+                return checkpoint
+        return {"ticker": ticker, "days": {}}
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]):
+        if not self.checkpoint_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, indent=4)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def run(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Run every trading day of the range that is not in the checkpoint yet.
+
+        Returns:
+            dict: the per-day records (signal, realized return, latency) and the throughput summary
+        """
+        checkpoint = self._load_checkpoint(ticker)
+        days = checkpoint["days"]
+
+        started = time.perf_counter()
+        completed = 0
+        for trade_date in self.trading_days(ticker, start_date, end_date):
+            if trade_date in days:
+                continue
+
+            day_started = time.perf_counter()
+            _, signal = self.graph.propagate(ticker, trade_date)
+            returns = self.realized_return(ticker, trade_date)
+            if self.reflect and returns is not None:
+                self.graph.reflect_and_remember(returns)
+            latency = time.perf_counter() - day_started
+
+            days[trade_date] = {
+                "signal": signal,
+                "return_pct": returns,
+                "latency_seconds": latency,
+            }
+            completed += 1
+            self._save_checkpoint(checkpoint)
+
+        elapsed = time.perf_counter() - started
+        in_range = {
+            date: record for date, record in sorted(days.items())
+            if start_date <= date <= end_date
+        }
+        latencies = [record["latency_seconds"] for record in in_range.values()]
+        return {
+            "ticker": ticker,
+            "days": in_range,
+            "completed_this_run": completed,
+            "elapsed_seconds": elapsed,
+            "days_per_hour": completed / elapsed * 3600 if completed else 0.0,
+            "mean_latency_seconds": float(np.mean(latencies)) if latencies else 0.0,
+            "max_latency_seconds": float(np.max(latencies)) if latencies else 0.0,
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a backtest report as a per-day table followed by the throughput summary."""
+    lines = [f"## Backtest of {report['ticker']}", "", "date        signal  return%  latency(s)"]
+    for date, record in report["days"].items():
+        returns = record["return_pct"]
+        returns = "n/a" if returns is None else f"{returns:+.2f}"
+        lines.append(
+            f"{date}  {str(record['signal']).strip()[:6]:<6}  {returns:>7}  {record['latency_seconds']:>10.2f}"
+        )
+    lines += [
+        "",
+        f"Days run: {report['completed_this_run']} in {report['elapsed_seconds']:.1f}s "
+        f"({report['days_per_hour']:.1f} days/hour)",
+        f"Latency: mean {report['mean_latency_seconds']:.2f}s, max {report['max_latency_seconds']:.2f}s",
+    ]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from tradingagents.default_config import DEFAULT_CONFIG
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    parser = argparse.ArgumentParser(description="Backtest the trading agents over a date range")
+    parser.add_argument("ticker")
+    parser.add_argument("start_date", help="yyyy-mm-dd")
+    parser.add_argument("end_date", help="yyyy-mm-dd")
+    parser.add_argument("--checkpoint", default=None, help="JSON checkpoint file")
+    parser.add_argument("--holding-days", type=int, default=1)
+    args = parser.parse_args()
+
+    checkpoint = args.checkpoint or os.path.join(
+        DEFAULT_CONFIG["results_dir"],
+        args.ticker,
+        f"backtest_{args.start_date}_{args.end_date}.json",
+    )
+    backtester = Backtester(
+        TradingAgentsGraph(config=DEFAULT_CONFIG),
+        checkpoint_path=checkpoint,
+        holding_days=args.holding_days,
+    )
+    print(format_report(backtester.run(args.ticker, args.start_date, args.end_date)))
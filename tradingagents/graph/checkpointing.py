@@ -0,0 +1,138 @@
+# TradingAgents/graph/checkpointing.py
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+try:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+except ImportError:  # optional dependency: langgraph-checkpoint-sqlite
+    SqliteSaver = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: leases only keep runs apart within one process
+    fcntl = None
+
+
+if SqliteSaver is not None:
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        """SqliteSaver that also serves the async graph API by running its calls in a thread."""
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, *, filter=None, before=None, limit=None):
+            items = await asyncio.to_thread(
+                lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+            )
+            for item in items:
+                yield item
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(
+                self.put, config, checkpoint, metadata, new_versions
+            )
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(
+                self.put_writes, config, writes, task_id, task_path
+            )
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def create_checkpointer(config: Dict[str, Any]) -> Optional[BaseCheckpointSaver]:
+    """Build the graph checkpointer selected by config["checkpointer"].
+
+    "sqlite" keeps the checkpoints in data_cache_dir/checkpoints.sqlite so an interrupted run
+    can be resumed by another process, "memory" keeps them for the life of the process and
+    "none" disables checkpointing.
+    """
+    kind = config.get("checkpointer", "none").lower()
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return InMemorySaver()
+    if kind == "sqlite":
+        if SqliteSaver is None:
+            raise ImportError(
+                "SQLite checkpointing requires the langgraph-checkpoint-sqlite package; "
+                "install it or set the checkpointer config to 'memory' or 'none'"
+            )
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+        conn = sqlite3.connect(
+            os.path.join(config["data_cache_dir"], "checkpoints.sqlite"),
+            check_same_thread=False,
+        )
+        return ThreadedSqliteSaver(conn)
+    raise ValueError(f"Unsupported checkpointer: {kind}")
+
+
+def thread_id_for(company_name: str, trade_date: str) -> str:
+    """Checkpoint thread of the run for a company on a trade date."""
+    return f"{company_name}-{trade_date}"
+
+
+def lease_path_for(config: Dict[str, Any]) -> Optional[str]:
+    """File whose byte-range locks lease checkpoint threads across processes, if they are shared."""
+    if config.get("checkpointer", "none").lower() != "sqlite":
+        return None
+    return os.path.join(config["data_cache_dir"], "checkpoints.leases")
+
+
+# threads leased by runs in this process, and the lease file descriptors (kept open: closing
+# any descriptor of a file drops all of this process's locks on it)
+_leased_threads = set()
+_lease_files: Dict[str, int] = {}
+_lease_lock = threading.Lock()
+
+
+def _lease_range(thread_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(thread_id.encode(), digest_size=7).digest(), "big")
+
+
+@contextlib.contextmanager
+def lease_thread(thread_id: str, lease_path: Optional[str] = None) -> Iterator[Tuple[str, bool]]:
+    """Hold a checkpoint thread for the length of one run.
+
+    Yields (thread_id, leased). A thread is leased to one run at a time, within the process
+    and, given lease_path, across the processes sharing it. A run that finds the thread held
+    must not resume it under the live run, so it gets a private thread id instead, with
+    leased False; its caller deletes that thread when the run ends.
+    """
+    with _lease_lock:
+        leased = thread_id not in _leased_threads
+        fd = None
+        if leased and lease_path is not None and fcntl is not None:
+            fd = _lease_files.get(lease_path)
+            if fd is None:
+                os.makedirs(os.path.dirname(lease_path), exist_ok=True)
+                fd = _lease_files[lease_path] = os.open(lease_path, os.O_RDWR | os.O_CREAT)
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, _lease_range(thread_id))
+            except OSError:
+                leased, fd = False, None
+        if leased:
+            _leased_threads.add(thread_id)
+
+    if not leased:
+        yield f"{thread_id}:{uuid.uuid4().hex}", False
+        return
+    try:
+        yield thread_id, True
+    finally:
+        with _lease_lock:
+            if fd is not None:
+                fcntl.lockf(fd, fcntl.LOCK_UN, 1, _lease_range(thread_id))
+            _leased_threads.discard(thread_id)
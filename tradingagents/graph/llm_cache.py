@@ -0,0 +1,156 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain LLM cache in a SQLite file, keyed by a hash of the model parameters and the full
+    prompt (for chat models, the serialized message list including any bound tools).
+
+    Once the stored responses exceed max_bytes, the least recently used ones are evicted.
+    Every call opens (and closes) its own connection, so the cache can be shared by threads
+    and processes.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_responses_accessed_at ON llm_responses (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection whose transaction commits (or rolls back) with the block, then closes."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _dumps(generations: Sequence[Generation]) -> str:
+        items = []
+        for generation in generations:
+            if isinstance(generation, ChatGeneration):
+                items.append(
+                    {
+                        "message": message_to_dict(generation.message),
+                        "generation_info": generation.generation_info,
+                    }
+                )
+            else:
+                items.append(
+                    {"text": generation.text, "generation_info": generation.generation_info}
+                )
+        return json.dumps(items)
+
+    @staticmethod
+    def _loads(value: str):
+        generations = []
+        for item in json.loads(value):
+            if "message" in item:
+                message = messages_from_dict([item["message"]])[0]
+                generations.append(
+                    ChatGeneration(message=message, generation_info=item["generation_info"])
+                )
+            else:
+                generations.append(
+                    Generation(text=item["text"], generation_info=item["generation_info"])
+                )
+        return generations
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        key = self._key(prompt, llm_string)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM llm_responses WHERE key=?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE llm_responses SET accessed_at=? WHERE key=?", (time.time(), key)
+            )
+        return self._loads(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        value = self._dumps(return_val)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?)",
+                (self._key(prompt, llm_string), value, len(value), time.time()),
+            )
+            # keep the most recently used responses that fit in max_bytes
+            conn.execute(
+                """
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total
+                        FROM llm_responses
+                    ) WHERE total > ?
+                )
+                """,
+                (self.max_bytes,),
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+    def size_bytes(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+
+_caches: Dict[tuple, SQLiteLLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def create_llm_cache(config: Dict[str, Any]) -> Optional[SQLiteLLMCache]:
+    """Return the shared LLM response cache if config["llm_cache"] enables it, else None."""
+    if not config.get("llm_cache", False):
+        return None
+
+    path = os.path.join(config["data_cache_dir"], "llm_cache.sqlite")
+    max_bytes = int(config.get("llm_cache_max_mb", 512) * 1024 * 1024)
+    key = (os.path.abspath(path), max_bytes)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = SQLiteLLMCache(path, max_bytes)
+            _caches[key] = cache
+        return cache
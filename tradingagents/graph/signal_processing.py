@@ -1,7 +1,53 @@
 # TradingAgents/graph/signal_processing.py
 
+import re
+import threading
+from typing import Optional
+
 from langchain_openai import ChatOpenAI
 
+# A decision word on its own, not part of a "BUY/HOLD/SELL" template echo or of "sell-off"
+_DECISION = r"(?<![\w/-])(BUY|HOLD|SELL)(?![\w/-])"
+_MARKUP = r"[\s*_:\-–—>#|]*"
+
+# Tiers of patterns, most specific first. The first tier that matches decides, unless its
+# matches disagree, in which case the signal is ambiguous and goes to the LLM.
+_RULE_TIERS = [
+    # the risk judge's "**Final Call**: BUY" line
+    re.compile(r"final\s+call" + _MARKUP + _DECISION, re.IGNORECASE),
+    # the trader's and analysts' "FINAL TRANSACTION PROPOSAL: **BUY**" line
+    re.compile(r"final\s+transaction\s+proposal" + _MARKUP + _DECISION, re.IGNORECASE),
+    # other labelled verdicts, e.g. "**Decision**: HOLD" or "Recommendation - Sell"
+    re.compile(
+        r"(?:final\s+)?(?:decision|recommendation|verdict|action)" + _MARKUP + _DECISION,
+        re.IGNORECASE,
+    ),
+    # a bolded verdict anywhere, e.g. "**SELL**"
+    re.compile(r"\*\*\s*" + _DECISION + r"\s*\*\*", re.IGNORECASE),
+    # a line holding nothing but the verdict, e.g. a closing "SELL" or "## **HOLD**"
+    re.compile(r"^" + _MARKUP + _DECISION + r"[\s*_.!]*$", re.IGNORECASE | re.MULTILINE),
+]
+
+# A negation shortly before the decision word on the same line, e.g. "do not **BUY**"
+_NEGATED = re.compile(r"\b(?:not|never|no|don't|avoid)\b[^\n.;]{0,20}$", re.IGNORECASE)
+
+
+def extract_decision(full_signal: str) -> Optional[str]:
+    """Extract BUY, SELL or HOLD from a decision text with rules, or None if it is ambiguous."""
+    for pattern in _RULE_TIERS:
+        matches = list(pattern.finditer(full_signal))
+        if any(
+            _NEGATED.search(full_signal, max(0, match.start(1) - 40), match.start(1))
+            for match in matches
+        ):
+            return None
+        decisions = {match.group(1).upper() for match in matches}
+        if len(decisions) == 1:
+            return decisions.pop()
+        if len(decisions) > 1:
+            return None
+    return None
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -9,23 +55,51 @@ class SignalProcessor:
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        # how often the rules decided and how often the LLM had to be asked
+        self.rule_hits = 0
+        self.llm_fallbacks = 0
+        self._lock = threading.Lock()
 
     def process_signal(self, full_signal: str) -> str:
         """
         Process a full trading signal to extract the core decision.
 
+        The common verdict formats are parsed locally; the LLM is only asked when the
+        rules find no decision or conflicting ones.
+
         Args:
             full_signal: Complete trading signal text
 
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
+        decision = self._extract(full_signal)
+        if decision is not None:
+            return decision
+        return self.quick_thinking_llm.invoke(self._messages(full_signal)).content
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Asynchronous version of process_signal."""
+        decision = self._extract(full_signal)
+        if decision is not None:
+            return decision
+        response = await self.quick_thinking_llm.ainvoke(self._messages(full_signal))
+        return response.content
+
+    def _extract(self, full_signal: str) -> Optional[str]:
+        decision = extract_decision(full_signal)
+        with self._lock:
+            if decision is None:
+                self.llm_fallbacks += 1
+            else:
+                self.rule_hits += 1
+        return decision
+
+    def _messages(self, full_signal: str):
+        return [
             (
                 "system",
                 "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
             ),
             ("human", full_signal),
         ]
-
-        return self.quick_thinking_llm.invoke(messages).content
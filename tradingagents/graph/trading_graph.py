@@ -1,6 +1,11 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import asyncio
+import contextlib
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import date
@@ -21,22 +26,32 @@ from tradingagents.agents.utils.agent_states import (
     RiskDebateState,
 )
 from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.run_cache import RunCache, run_cache
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .checkpointing import create_checkpointer, lease_path_for, lease_thread, thread_id_for
+from .llm_cache import create_llm_cache
 
 
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
 
+    # Serializes writes of the state logs across concurrent runs
+    _log_lock = threading.Lock()
+
     def __init__(
         self,
         selected_analysts=["market", "social", "news", "fundamentals"],
         debug=False,
         config: Dict[str, Any] = None,
+        checkpointer=None,
+        deep_thinking_llm=None,
+        quick_thinking_llm=None,
+        memories: Optional[Dict[str, Any]] = None,
     ):
         """Initialize the trading agents graph and components.
 
@@ -44,6 +59,10 @@ class TradingAgentsGraph:
             selected_analysts: List of analyst types to include
             debug: Whether to run in debug mode
             config: Configuration dictionary. If None, uses default config
+            checkpointer: LangGraph checkpointer. If None, one is created from config["checkpointer"]
+            deep_thinking_llm: Chat model of the managers. If None, one is created from config
+            quick_thinking_llm: Chat model of the other agents. If None, one is created from config
+            memories: Memories by name (e.g. "bull_memory") to use instead of creating them
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
@@ -57,27 +76,34 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
+        # Opt-in persistent cache of LLM responses, shared by the quick and deep models
+        llm_cache = create_llm_cache(self.config)
+
         # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+        if deep_thinking_llm is not None and quick_thinking_llm is not None:
+            self.deep_thinking_llm = deep_thinking_llm
+            self.quick_thinking_llm = quick_thinking_llm
+        elif self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
+            self.deep_thinking_llm = deep_thinking_llm or ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=llm_cache)
+            self.quick_thinking_llm = quick_thinking_llm or ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=llm_cache)
         elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = deep_thinking_llm or ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=llm_cache)
+            self.quick_thinking_llm = quick_thinking_llm or ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=llm_cache)
         elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            self.deep_thinking_llm = deep_thinking_llm or ChatGoogleGenerativeAI(model=self.config["deep_think_llm"], cache=llm_cache)
+            self.quick_thinking_llm = quick_thinking_llm or ChatGoogleGenerativeAI(model=self.config["quick_think_llm"], cache=llm_cache)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
         
         self.toolkit = Toolkit(config=self.config)
 
         # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
+        memories = memories or {}
+        self.bull_memory = memories.get("bull_memory") or FinancialSituationMemory("bull_memory", self.config)
+        self.bear_memory = memories.get("bear_memory") or FinancialSituationMemory("bear_memory", self.config)
+        self.trader_memory = memories.get("trader_memory") or FinancialSituationMemory("trader_memory", self.config)
+        self.invest_judge_memory = memories.get("invest_judge_memory") or FinancialSituationMemory("invest_judge_memory", self.config)
+        self.risk_manager_memory = memories.get("risk_manager_memory") or FinancialSituationMemory("risk_manager_memory", self.config)
 
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -104,10 +130,21 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to date to full state dict
+
+        # Checkpoint every node so an interrupted run resumes where it stopped
+        self.checkpointer = (
+            checkpointer if checkpointer is not None else create_checkpointer(self.config)
+        )
+        self.checkpoint_lease_path = lease_path_for(self.config)
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            prefetch=self.config.get("prefetch_data", False),
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=self.checkpointer,
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -159,26 +196,176 @@ class TradingAgentsGraph:
 
         self.ticker = company_name
 
+        final_state = self._run_graph(company_name, trade_date)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        self._log_state(trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def propagate_batch(self, tickers, trade_date, max_concurrency=None):
+        """Run the graph for several companies concurrently on a specific date.
+
+        Yields (ticker, final_state, processed_signal) as each run completes. A run that fails
+        yields (ticker, None, exception) instead, and the other runs carry on. The runs share
+        one dataflow cache, so data common to all of them (e.g. global news) is fetched
+        once; reports, logs and signals are kept per run. curr_state is not updated.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.config.get("batch_max_concurrency", 4)
+        shared_cache = RunCache()
+
+        def run(ticker):
+            final_state = self._run_graph(ticker, trade_date, cache=shared_cache)
+            self._log_state(trade_date, final_state)
+            return final_state, self.process_signal(final_state["final_trade_decision"])
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {
+                executor.submit(contextvars.copy_context().run, run, ticker): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                try:
+                    final_state, processed_signal = future.result()
+                except Exception as e:
+                    yield futures[future], None, e
+                else:
+                    yield futures[future], final_state, processed_signal
+
+    def _run_graph(self, company_name, trade_date, cache=None):
+        """Invoke the graph once and return its final state."""
+
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
-
-        if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
+        with self._leased_graph_args(company_name, trade_date) as args:
+            graph_input = self._resume_or_start(init_agent_state, args["config"])
+
+            # Dataflow results are memoized for the duration of the run
+            with run_cache(cache):
+                if self.debug:
+                    # Debug mode with tracing
+                    trace = []
+                    for chunk in self.graph.stream(graph_input, **args):
+                        if len(chunk["messages"]) == 0:
+                            pass
+                        else:
+                            chunk["messages"][-1].pretty_print()
+                            trace.append(chunk)
+
+                    final_state = trace[-1]
                 else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                    # Standard mode without tracing
+                    final_state = self.graph.invoke(graph_input, **args)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            self._end_thread(args["config"])
+        return final_state
+
+    @contextlib.contextmanager
+    def _leased_graph_args(self, company_name, trade_date):
+        """Graph arguments of a run, on its checkpoint thread for as long as the run lasts.
+
+        While another run of the same company and date holds the thread, this run gets a
+        private thread rather than resuming the live one, and that thread is deleted when
+        the run ends, however it ends.
+        """
+        if self.checkpointer is None:
+            yield self.propagator.get_graph_args()
+            return
+        with lease_thread(
+            thread_id_for(company_name, trade_date), self.checkpoint_lease_path
+        ) as (thread_id, leased):
+            try:
+                yield self.propagator.get_graph_args(thread_id)
+            finally:
+                if not leased:
+                    self.checkpointer.delete_thread(thread_id)
+
+    @contextlib.asynccontextmanager
+    async def _aleased_graph_args(self, company_name, trade_date):
+        """Asynchronous version of _leased_graph_args."""
+        if self.checkpointer is None:
+            yield self.propagator.get_graph_args()
+            return
+        with lease_thread(
+            thread_id_for(company_name, trade_date), self.checkpoint_lease_path
+        ) as (thread_id, leased):
+            try:
+                yield self.propagator.get_graph_args(thread_id)
+            finally:
+                if not leased:
+                    await self.checkpointer.adelete_thread(thread_id)
+
+    def _resume_or_start(self, init_agent_state, graph_config):
+        """Input that resumes an interrupted run of the thread, or starts a new run."""
+        if self.checkpointer is None:
+            return init_agent_state
+        snapshot = self.graph.get_state(graph_config)
+        if snapshot.next:
+            # an earlier run stopped part-way: continue after its last completed node
+            return None
+        if snapshot.values:
+            # the earlier run finished but its checkpoints were kept: start over on a clean thread
+            self.checkpointer.delete_thread(graph_config["configurable"]["thread_id"])
+        return init_agent_state
+
+    def _end_thread(self, graph_config):
+        """Drop the checkpoints of a completed run; only interrupted runs need to persist."""
+        if self.checkpointer is not None:
+            self.checkpointer.delete_thread(graph_config["configurable"]["thread_id"])
+
+    async def _aend_thread(self, graph_config):
+        """Asynchronous version of _end_thread."""
+        if self.checkpointer is not None:
+            await self.checkpointer.adelete_thread(graph_config["configurable"]["thread_id"])
+
+    async def _aresume_or_start(self, init_agent_state, graph_config):
+        """Asynchronous version of _resume_or_start."""
+        if self.checkpointer is None:
+            return init_agent_state
+        snapshot = await self.graph.aget_state(graph_config)
+        if snapshot.next:
+            return None
+        if snapshot.values:
+            await self.checkpointer.adelete_thread(graph_config["configurable"]["thread_id"])
+        return init_agent_state
+
+    async def apropagate(self, company_name, trade_date):
+        """Run the trading agents graph without blocking the event loop."""
+
+        self.ticker = company_name
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        async with self._aleased_graph_args(company_name, trade_date) as args:
+            graph_input = await self._aresume_or_start(init_agent_state, args["config"])
+
+            # Dataflow results are memoized for the duration of the run
+            with run_cache():
+                if self.debug:
+                    # Debug mode with tracing
+                    trace = []
+                    async for chunk in self.graph.astream(graph_input, **args):
+                        if len(chunk["messages"]) == 0:
+                            pass
+                        else:
+                            chunk["messages"][-1].pretty_print()
+                            trace.append(chunk)
+
+                    final_state = trace[-1]
+                else:
+                    # Standard mode without tracing
+                    final_state = await self.graph.ainvoke(graph_input, **args)
+
+            await self._aend_thread(args["config"])
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -187,11 +374,63 @@ class TradingAgentsGraph:
         self._log_state(trade_date, final_state)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, await self.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+
+    async def astream(self, company_name, trade_date):
+        """Asynchronously yield the graph state after every step of a run."""
+
+        self.ticker = company_name
+
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        async with self._aleased_graph_args(company_name, trade_date) as args:
+            graph_input = await self._aresume_or_start(init_agent_state, args["config"])
+
+            # The graph runs in its own task, so its run cache lives in that task's context and
+            # the consumer can stop iterating at any point without resetting it from elsewhere
+            queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+            async def produce():
+                try:
+                    with run_cache():
+                        async for chunk in self.graph.astream(graph_input, **args):
+                            await queue.put(("chunk", chunk))
+                except Exception as exc:
+                    await queue.put(("error", exc))
+                else:
+                    await queue.put(("done", None))
+
+            producer = asyncio.create_task(produce())
+            final_state = None
+            try:
+                while True:
+                    kind, item = await queue.get()
+                    if kind == "done":
+                        break
+                    if kind == "error":
+                        raise item
+                    final_state = item
+                    yield item
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await producer
+
+            # the stream ran to completion (an abandoned one keeps its checkpoints to resume)
+            await self._aend_thread(args["config"])
+
+        if final_state is not None:
+            self.curr_state = final_state
+            self._log_state(trade_date, final_state)
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = final_state["company_of_interest"]
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -221,34 +460,43 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        # Save to file; each ticker's log only holds that ticker's runs
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        with self._log_lock:
+            ticker_log = self.log_states_dict.setdefault(ticker, {})
+            ticker_log[str(trade_date)] = entry
+            with open(
+                f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+                "w",
+            ) as f:
+                json.dump(ticker_log, f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
-        )
+        # the five memories store the same situation, which is embedded once
+        with run_cache():
+            self.reflector.reflect_bull_researcher(
+                self.curr_state, returns_losses, self.bull_memory
+            )
+            self.reflector.reflect_bear_researcher(
+                self.curr_state, returns_losses, self.bear_memory
+            )
+            self.reflector.reflect_trader(
+                self.curr_state, returns_losses, self.trader_memory
+            )
+            self.reflector.reflect_invest_judge(
+                self.curr_state, returns_losses, self.invest_judge_memory
+            )
+            self.reflector.reflect_risk_manager(
+                self.curr_state, returns_losses, self.risk_manager_memory
+            )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Asynchronously process a signal to extract the core decision."""
+        return await self.signal_processor.aprocess_signal(full_signal)